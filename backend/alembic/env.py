@@ -8,14 +8,14 @@ from alembic import context
 # Import the Base and all models
 from app.db.base import Base
 from app.db.models import User, Panel, TestType, TestAlias, Report, TestResult
-from app.core.config import settings
+from app.core.config import get_settings
 
 # this is the Alembic Config object, which provides
 # access to the values within the .ini file in use.
 config = context.config
 
 # Override sqlalchemy.url with the one from settings
-config.set_main_option("sqlalchemy.url", settings.DATABASE_URL)
+config.set_main_option("sqlalchemy.url", get_settings().DATABASE_URL)
 
 # Interpret the config file for Python logging.
 # This line sets up loggers basically.
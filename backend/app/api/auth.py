@@ -3,11 +3,11 @@ from fastapi import APIRouter, Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordRequestForm
 from sqlalchemy.orm import Session
 
-from app.core.config import settings
+from app.core.config import Settings, get_settings
 from app.core.dependencies import get_db
 from app.core.security import verify_password, create_access_token
 from app.crud.users import get_user_by_email, create_user
-from app.schemas.auth import UserRegister, Token
+from app.schemas.auth import UserRegister, Token, validate_login_email
 
 router = APIRouter(prefix="/auth", tags=["authentication"])
 
@@ -43,7 +43,8 @@ def register(
 @router.post("/login", response_model=Token)
 def login(
     form_data: OAuth2PasswordRequestForm = Depends(),
-    db: Session = Depends(get_db)
+    db: Session = Depends(get_db),
+    settings: Settings = Depends(get_settings)
 ):
     """
     Login with email and password to receive JWT token.
@@ -53,7 +54,9 @@ def login(
     - 2.2: Reject login with incorrect credentials
     """
     # Get user by email (username field contains email)
-    user = get_user_by_email(db, form_data.username)
+    # Malformed emails cannot belong to a registered user, so skip the lookup
+    email = validate_login_email(form_data.username)
+    user = get_user_by_email(db, email) if email else None
     
     # Verify user exists and password is correct
     if not user or not verify_password(form_data.password, user.hashed_password):
@@ -13,8 +13,8 @@ from app.schemas.reports import ReportSummary
 from app.crud import reports as report_crud
 from app.crud import tests as test_crud
 from app.ocr.gemini_engine import extract_with_gemini
-from app.parsing.mappings import map_test_name_to_type
-from app.rules.reference_ranges import compute_status
+from app.parsing.mappings import map_test_names_to_types
+from app.rules.reference_ranges import compute_status_batch
 
 
 
@@ -144,29 +144,31 @@ async def upload_report(
         saved_count = 0
         skipped_tests = []
         
-        # Process each parsed test
-        for test_data in parsed_tests:
+        # Requirements 6.1, 6.2: Map each parsed test name to a TestType using aliases
+        mapped_tests = []
+        test_types = map_test_names_to_types(
+            db, [test_data.get("test_name_raw") for test_data in parsed_tests]
+        )
+        for test_data, test_type in zip(parsed_tests, test_types):
             test_name_raw = test_data.get("test_name_raw")
-            value = test_data.get("value")
-            unit = test_data.get("unit", "")
-            
-            # Requirements 6.1, 6.2: Map test name to TestType using aliases
-            test_type = map_test_name_to_type(db, test_name_raw)
             
             # Requirement 6.3: Skip unknown test names
             if test_type is None:
                 skipped_tests.append(test_name_raw)
                 continue
             
-            # Requirements 7.1, 7.2, 7.3: Compute personalized status based on reference ranges
-            # Use patient demographics for personalized reference ranges
-            test_status = compute_status(
-                test_type=test_type,
-                value=value,
-                patient_gender=patient_gender,
-                patient_age=patient_age
-            )
-            
+            mapped_tests.append((test_type, test_data.get("value"), test_data.get("unit", "")))
+        
+        # Requirements 7.1, 7.2, 7.3: Compute personalized status based on reference ranges
+        # Use patient demographics for personalized reference ranges
+        statuses = compute_status_batch(
+            test_types=[test_type for test_type, _, _ in mapped_tests],
+            values=[value for _, value, _ in mapped_tests],
+            patient_gender=patient_gender,
+            patient_age=patient_age
+        )
+        
+        for (test_type, value, unit), test_status in zip(mapped_tests, statuses):
             # Requirements 8.1, 8.2: Save TestResult record
             test_crud.create_test_result(
                 db=db,
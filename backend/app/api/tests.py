@@ -1,15 +1,19 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+import hashlib
+
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, status
+from pydantic import TypeAdapter
+from sqlalchemy import Engine, event
 from sqlalchemy.orm import Session
 
 from app.core.dependencies import get_db, get_current_user
-from app.db.models import User
+from app.db.models import Panel, User
 from app.crud.panels import get_all_panels, get_panel_by_key, get_panel_tests
-from app.crud.tests import get_test_history, get_test_type_by_key, get_latest_test_result, get_previous_test_result
+from app.crud.tests import get_test_history_points, get_test_type_by_key, get_latest_test_result, get_previous_test_result
 from app.schemas.panels import PanelResponse, TestTypeResponse
 from app.schemas.tests import (
     TestHistoryResponse, 
     TestHistoryMetadata, 
-    TestHistoryDataPoint,
+    HISTORY_PAYLOAD_ADAPTER,
     LatestInsightResponse,
     LatestTestResult,
     GuidanceData
@@ -18,9 +22,67 @@ from app.rules.guidance_engine import generate_guidance
 
 router = APIRouter(tags=["tests"])
 
+# Panels are only written by seeding, so the serialized catalog is cached
+_PANEL_LIST_ADAPTER = TypeAdapter(list[PanelResponse])
+
+# Serialized panel catalog and ETag, per database engine
+_panel_catalog_cache: dict[Engine, tuple[bytes, str]] = {}
+
+
+def _get_panel_catalog(db: Session) -> tuple[bytes, str]:
+    """
+    Return the serialized panel catalog and its ETag, building it on first use.
+    
+    After the first request for a database, neither the query nor Pydantic
+    serialization runs again until invalidate_panel_catalog() is called.
+    """
+    bind = db.get_bind()
+    catalog = _panel_catalog_cache.get(bind)
+    if catalog is None:
+        body = _PANEL_LIST_ADAPTER.dump_json(
+            _PANEL_LIST_ADAPTER.validate_python(get_all_panels(db), from_attributes=True)
+        )
+        etag = '"' + hashlib.sha256(body).hexdigest() + '"'
+        catalog = _panel_catalog_cache[bind] = (body, etag)
+    return catalog
+
+
+def invalidate_panel_catalog() -> None:
+    """
+    Drop the cached panel catalog so the next request re-reads the database.
+    
+    Called automatically whenever a Panel is written through the ORM in this
+    process. seed_data.py runs as a separate process, so a running server
+    must be restarted to pick up panels it adds.
+    """
+    _panel_catalog_cache.clear()
+
+
+@event.listens_for(Panel, "after_insert")
+@event.listens_for(Panel, "after_update")
+@event.listens_for(Panel, "after_delete")
+def _invalidate_panel_catalog_on_write(mapper, connection, target) -> None:
+    invalidate_panel_catalog()
+
+
+def _etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """Check an If-None-Match header against an ETag using weak comparison."""
+    if not if_none_match:
+        return False
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate == "*":
+            return True
+        if candidate.startswith("W/"):
+            candidate = candidate[2:]
+        if candidate == etag:
+            return True
+    return False
+
 
 @router.get("/panels", response_model=list[PanelResponse])
 def get_panels(
+    request: Request,
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
@@ -33,8 +95,12 @@ def get_panels(
     - 9.3: Require authentication (401 if not authenticated)
     - 9.5: Return results in consistent order
     """
-    panels = get_all_panels(db)
-    return panels
+    body, etag = _get_panel_catalog(db)
+    
+    if _etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
+    
+    return Response(content=body, media_type="application/json", headers={"ETag": etag})
 
 
 @router.get("/panels/{panel_key}/tests", response_model=list[TestTypeResponse])
@@ -91,7 +157,7 @@ def get_test_history_endpoint(
         )
     
     # Get test history for the user
-    test_results = get_test_history(db, current_user.id, test_key)
+    history_points = get_test_history_points(db, current_user.id, test_key)
     
     # Build metadata
     metadata = TestHistoryMetadata(
@@ -103,18 +169,12 @@ def get_test_history_endpoint(
         ref_high=test_type.ref_high
     )
     
-    # Build data points
-    data = [
-        TestHistoryDataPoint(
-            timestamp=result.created_at,
-            value=result.value,
-            unit=result.unit,
-            status=result.status
-        )
-        for result in test_results
-    ]
-    
-    return TestHistoryResponse(metadata=metadata, data=data)
+    # Encode the selected rows directly, skipping per-row model construction
+    content = HISTORY_PAYLOAD_ADAPTER.dump_json({
+        "metadata": metadata,
+        "data": [point._asdict() for point in history_points]
+    })
+    return Response(content=content, media_type="application/json")
 
 
 @router.get("/tests/{test_key}/latest-insight", response_model=LatestInsightResponse)
@@ -158,7 +218,7 @@ def get_latest_insight(
     )
     
     # Requirements 12.3, 12.4, 12.5: Generate guidance with trend and disclaimer
-    guidance_data = generate_guidance(
+    guidance_result = generate_guidance(
         test_type=test_type,
         value=latest_result.value,
         status=latest_result.status,
@@ -182,15 +242,12 @@ def get_latest_insight(
             status=previous_result.status
         )
     
-    guidance = GuidanceData(
-        message=guidance_data["message"],
-        trend=guidance_data["trend"],
-        suggestions=guidance_data["suggestions"],
-        disclaimer=guidance_data["disclaimer"]
-    )
+    guidance = GuidanceData(**guidance_result.to_dict())
     
-    return LatestInsightResponse(
+    insight = LatestInsightResponse(
         latest=latest,
         previous=previous,
         guidance=guidance
     )
+    # Serialize with pydantic-core directly, as the history endpoint does
+    return Response(content=insight.model_dump_json(), media_type="application/json")
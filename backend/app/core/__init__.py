@@ -1,6 +1,6 @@
 # Core configuration and security
 
-from app.core.config import settings
+from app.core.config import get_settings
 from app.core.security import (
     verify_password,
     get_password_hash,
@@ -9,7 +9,7 @@ from app.core.security import (
 )
 
 __all__ = [
-    "settings",
+    "get_settings",
     "verify_password",
     "get_password_hash",
     "create_access_token",
@@ -1,3 +1,4 @@
+from functools import lru_cache
 from pydantic_settings import BaseSettings, SettingsConfigDict
 from typing import Optional
 
@@ -16,4 +17,13 @@ class Settings(BaseSettings):
     )
 
 
-settings = Settings()
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """
+    Return the process-wide Settings instance.
+    
+    The .env file and environment are read and validated only once; call
+    get_settings.cache_clear() to force a rebuild after changing them.
+    Can be used directly as a FastAPI dependency.
+    """
+    return Settings()
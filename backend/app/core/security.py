@@ -5,7 +5,7 @@ import os
 from jose import JWTError, jwt
 from passlib.context import CryptContext
 
-from app.core.config import settings
+from app.core.config import get_settings
 
 # Password hashing context
 # Use faster pbkdf2_sha256 for testing, bcrypt for production
@@ -55,6 +55,7 @@ def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -
     Returns:
         Encoded JWT token as a string
     """
+    settings = get_settings()
     to_encode = data.copy()
     
     if expires_delta:
@@ -81,6 +82,7 @@ def decode_access_token(token: str) -> dict:
     Raises:
         JWTError: If the token is invalid or expired
     """
+    settings = get_settings()
     try:
         payload = jwt.decode(token, settings.JWT_SECRET_KEY, algorithms=[settings.JWT_ALGORITHM])
         return payload
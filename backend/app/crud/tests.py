@@ -72,6 +72,43 @@ def get_test_history(
     )
 
 
+def get_test_history_points(
+    db: Session,
+    user_id: int,
+    test_key: str
+) -> list:
+    """
+    Get the history data points for a user and test type, oldest first.
+    
+    Same rows as get_test_history(), but only the columns exposed by the
+    history endpoint are selected, so no TestResult objects are built.
+    
+    Args:
+        db: Database session
+        user_id: ID of the user
+        test_key: Key of the test type (e.g., 'WBC', 'GLUCOSE')
+        
+    Returns:
+        List of rows with timestamp, value, unit and status attributes
+        
+    Validates: Requirements 11.1, 11.2
+    """
+    return (
+        db.query(
+            TestResult.created_at.label("timestamp"),
+            TestResult.value,
+            TestResult.unit,
+            TestResult.status
+        )
+        .join(TestResult.report)
+        .join(TestResult.test_type)
+        .filter(Report.user_id == user_id)
+        .filter(TestType.key == test_key)
+        .order_by(TestResult.created_at.asc())
+        .all()
+    )
+
+
 def get_latest_test_result(
     db: Session,
     user_id: int,
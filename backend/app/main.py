@@ -6,7 +6,7 @@ from sqlalchemy.exc import SQLAlchemyError
 import logging
 
 from app.api import auth, users, reports, tests
-from app.core.config import settings
+from app.core.config import get_settings
 
 # Configure logging
 logging.basicConfig(
@@ -22,6 +22,7 @@ app = FastAPI(
 )
 
 # Enable CORS for frontend communication
+settings = get_settings()
 cors_origins = ["*"]  # Configure appropriately for production
 if hasattr(settings, 'CORS_ORIGINS'):
     cors_origins = settings.CORS_ORIGINS.split(",") if isinstance(settings.CORS_ORIGINS, str) else settings.CORS_ORIGINS
@@ -13,7 +13,7 @@ from google import genai
 from google.genai import types
 from PyPDF2 import PdfReader
 
-from app.core.config import settings
+from app.core.config import get_settings
 
 
 @dataclass
@@ -43,6 +43,7 @@ class GeminiEngine:
         """Initialize Gemini engine with API key."""
         # Only initialize once (singleton pattern)
         if GeminiEngine._client is None:
+            settings = get_settings()
             if not settings.GEMINI_API_KEY:
                 raise ValueError(
                     "GEMINI_API_KEY not found in environment variables. "
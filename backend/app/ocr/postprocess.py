@@ -7,6 +7,23 @@ This module provides utilities to clean OCR output and fix common OCR errors.
 import re
 
 
+# Letters OCR commonly reads in place of digits
+_OCR_DIGIT_FIXES = str.maketrans('lIOSB', '11058')
+
+# A confusable letter between digits, or at a word edge next to a digit;
+# 'S' is not fixed at the start of a word and 'B' only between digits
+_OCR_DIGIT_ERROR_RE = re.compile(
+    r'(?<=\d)[lIOSB](?=\d)'
+    r'|\b[lIO](?=\d)'
+    r'|(?<=\d)[lIOS]\b'
+)
+
+
+def _fix_ocr_digit(match: re.Match) -> str:
+    """Replace a matched OCR letter with the digit it stands for."""
+    return match.group().translate(_OCR_DIGIT_FIXES)
+
+
 def clean_ocr_text(raw_text: str) -> str:
     """
     Clean OCR output to improve parsing accuracy.
@@ -39,31 +56,9 @@ def clean_ocr_text(raw_text: str) -> str:
     lines = [re.sub(r'[ \t]+', ' ', line) for line in lines]
     text = '\n'.join(lines)
     
-    # Fix common OCR errors in numeric contexts
-    # These patterns look for likely numeric values and fix common mistakes
-    
-    # Fix 'l' (lowercase L) that should be '1' in numeric contexts
-    # Pattern: letter 'l' surrounded by digits or at start of number
-    text = re.sub(r'(\d)l(\d)', r'\g<1>1\g<2>', text)  # 5l2 -> 512
-    text = re.sub(r'\bl(\d)', r'1\g<1>', text)  # l5 -> 15
-    text = re.sub(r'(\d)l\b', r'\g<1>1', text)  # 5l -> 51
-    
-    # Fix 'O' (capital O) that should be '0' in numeric contexts
-    text = re.sub(r'(\d)O(\d)', r'\g<1>0\g<2>', text)  # 5O2 -> 502
-    text = re.sub(r'\bO(\d)', r'0\g<1>', text)  # O5 -> 05
-    text = re.sub(r'(\d)O\b', r'\g<1>0', text)  # 5O -> 50
-    
-    # Fix 'I' (capital I) that should be '1' in numeric contexts
-    text = re.sub(r'(\d)I(\d)', r'\g<1>1\g<2>', text)  # 5I2 -> 512
-    text = re.sub(r'\bI(\d)', r'1\g<1>', text)  # I5 -> 15
-    text = re.sub(r'(\d)I\b', r'\g<1>1', text)  # 5I -> 51
-    
-    # Fix 'S' that should be '5' in numeric contexts
-    text = re.sub(r'(\d)S(\d)', r'\g<1>5\g<2>', text)  # 1S2 -> 152
-    text = re.sub(r'(\d)S\b', r'\g<1>5', text)  # 9S -> 95
-    
-    # Fix 'B' that should be '8' in numeric contexts
-    text = re.sub(r'(\d)B(\d)', r'\g<1>8\g<2>', text)  # 1B2 -> 182
+    # Fix common OCR errors in numeric contexts (l/I -> 1, O -> 0, S -> 5,
+    # B -> 8), e.g. 5l2 -> 512, O5 -> 05, 9S -> 95, 1B2 -> 182
+    text = _OCR_DIGIT_ERROR_RE.sub(_fix_ocr_digit, text)
     
     # Remove zero-width spaces and other invisible characters
     text = re.sub(r'[\u200b-\u200f\ufeff]', '', text)
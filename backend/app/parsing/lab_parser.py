@@ -7,7 +7,135 @@ This module is kept for backward compatibility and testing purposes only.
 """
 
 import re
-from typing import List, Dict, Optional
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Dict, Iterator, List, Optional, Tuple
+
+
+# Keywords for CBC tests
+_CBC_KEYWORDS = (
+    'wbc', 'white blood', 'leukocyte',
+    'rbc', 'red blood', 'erythrocyte',
+    'hemoglobin', 'haemoglobin', 'hgb', 'hb',
+    'hematocrit', 'haematocrit', 'hct',
+    'platelet', 'plt', 'thrombocyte',
+    'mcv', 'mean corpuscular', 'mean cell volume'
+)
+
+# Keywords for Metabolic Panel tests
+_METABOLIC_KEYWORDS = (
+    'glucose', 'glu', 'blood sugar', 'fasting glucose',
+    'bun', 'urea nitrogen', 'urea',
+    'creatinine', 'creat',
+    'sodium', 'na',
+    'potassium', 'k',
+    'chloride', 'cl',
+    'co2', 'carbon dioxide', 'bicarbonate', 'hco3',
+    'calcium'  # Removed 'ca' to avoid false positives with 'hba1c'
+)
+
+# Keywords for Lipid Panel tests
+_LIPID_KEYWORDS = (
+    'cholesterol', 'chol',
+    'ldl', 'low density',
+    'hdl', 'high density',
+    'triglyceride', 'trig', 'tg'
+)
+
+# Supported keywords by panel, exactly as matched by _is_supported_test
+_SUPPORTED_TEST_KEYWORDS = MappingProxyType({
+    "CBC": _CBC_KEYWORDS,
+    "METABOLIC": _METABOLIC_KEYWORDS,
+    "LIPID": _LIPID_KEYWORDS,
+})
+
+# Common tests that might partially match supported keywords
+_UNSUPPORTED_TESTS = (
+    'hba1c', 'a1c', 'hemoglobin a1c',  # Diabetes test (contains 'hb')
+    'vitamin', 'vit',
+    'tsh', 'thyroid',
+    't3', 't4',
+    'ferritin',
+    'b12', 'cobalamin',
+    'folate', 'folic acid',
+    'psa', 'prostate',
+    'crp', 'c-reactive',
+    'albumin',
+    'bilirubin',
+    'ggt',
+    'protein',
+    'magnesium',
+    'phosphorus', 'phosphate'
+)
+
+# Short abbreviations that need word boundary checks to avoid false matches
+_UNSUPPORTED_ABBREVIATIONS = (
+    'alt', 'ast', 'alp',  # Liver enzymes
+    'mg'
+)
+
+# Every keyword compiled into one alternation so a name is scanned once by
+# the regex engine instead of once per keyword
+_SUPPORTED_KEYWORD_RE = re.compile(
+    '|'.join(map(re.escape, _CBC_KEYWORDS + _METABOLIC_KEYWORDS + _LIPID_KEYWORDS))
+)
+_UNSUPPORTED_TEST_RE = re.compile(
+    r'\b(?:' + '|'.join(map(re.escape, _UNSUPPORTED_ABBREVIATIONS)) + r')\b|'
+    + '|'.join(map(re.escape, _UNSUPPORTED_TESTS))
+)
+
+
+# Cheap pre-checks run before the line patterns
+_DIGIT_RE = re.compile(r'\d')
+_LETTER_RE = re.compile(r'[a-zA-Z]')
+
+# Regex patterns for different lab report formats, in priority order
+_LINE_PATTERNS = tuple(re.compile(pattern) for pattern in (
+    # Pattern 1: <name> <value> <unit>
+    # Example: "WBC 7.2 10^3/µL" or "White Blood Cells 7.2 10^3/µL" or "CO2 25 mmol/L"
+    r'^([A-Za-z0-9][A-Za-z0-9\s\-]*?)\s+([\d.]+)\s+([A-Za-z0-9/^µ%°\-\+]+)$',
+    
+    # Pattern 2: <name>: <value> <unit>
+    # Example: "Glucose: 95 mg/dL" or "CO2: 25 mmol/L"
+    r'^([A-Za-z0-9][A-Za-z0-9\s\-]*?):\s*([\d.]+)\s+([A-Za-z0-9/^µ%°\-\+]+)$',
+    
+    # Pattern 3: <name> <value><unit> (no space between value and unit)
+    # Example: "Hemoglobin 14.5g/dL"
+    r'^([A-Za-z0-9][A-Za-z0-9\s\-]*?)\s+([\d.]+)([A-Za-z0-9/^µ%°\-\+]+)$',
+    
+    # Pattern 4: <name>: <value> (no unit)
+    # Example: "Hematocrit: 42.5" or "CO2: 25"
+    r'^([A-Za-z0-9][A-Za-z0-9\s\-]*?):\s*([\d.]+)\s*$',
+    
+    # Pattern 5: <name> <value> (no unit, space separated)
+    # Example: "Platelets 250" or "CO2 25"
+    r'^([A-Za-z0-9][A-Za-z0-9\s\-]*?)\s+([\d.]+)\s*$',
+    
+    # Pattern 6: Table format with multiple spaces/tabs
+    # Example: "WBC    7.2    10^3/µL"
+    r'^([A-Za-z0-9][A-Za-z0-9\s\-]*?)\s{2,}([\d.]+)\s{2,}([A-Za-z0-9/^µ%°\-\+]+)$',
+    
+    # Pattern 7: Table format with tabs
+    # Example: "WBC\t7.2\t10^3/µL"
+    r'^([A-Za-z0-9][A-Za-z0-9\s\-]*?)\t+([\d.]+)\t+([A-Za-z0-9/^µ%°\-\+]+)$',
+))
+
+# All line patterns as one alternation, so a single scan finds the first
+# pattern that matches; the last matched group identifies which one it was
+_LINE_RE = re.compile('|'.join('(?:%s)' % pattern.pattern for pattern in _LINE_PATTERNS))
+
+
+def _build_line_alternatives() -> Dict[int, Tuple[int, slice]]:
+    """Map each pattern's last group number in _LINE_RE to (pattern index, group slice)."""
+    alternatives = {}
+    offset = 0
+    for index, pattern in enumerate(_LINE_PATTERNS):
+        alternatives[offset + pattern.groups] = (index, slice(offset, offset + pattern.groups))
+        offset += pattern.groups
+    return alternatives
+
+
+_LINE_ALTERNATIVES = _build_line_alternatives()
 
 
 # Inline helper functions (previously from app.ocr.postprocess)
@@ -89,17 +217,8 @@ def parse_lab_report(ocr_result: dict) -> List[Dict]:
     # Clean the OCR text
     cleaned_text = clean_ocr_text(raw_text)
     
-    # Split into lines
-    lines = cleaned_text.split('\n')
-    
-    # Parse each line for test results
-    results = []
-    for line in lines:
-        parsed = _parse_line(line)
-        if parsed:
-            results.append(parsed)
-    
-    return results
+    # Split into lines and parse each one for test results
+    return [parsed for parsed in map(_parse_line, cleaned_text.splitlines()) if parsed]
 
 
 def _parse_line(line: str) -> Optional[Dict]:
@@ -118,81 +237,100 @@ def _parse_line(line: str) -> Optional[Dict]:
     Returns:
         Dictionary with test_name_raw, value, and unit, or None if no match
     """
-    if not line or len(line.strip()) < 3:
+    if not line:
         return None
     
     line = line.strip()
     
-    # Skip header lines (all caps, no numbers)
-    if line.isupper() and not re.search(r'\d', line):
+    # Lines without a digit carry no value (headers, names, blank lines), so
+    # reject them before they reach the patterns or the line cache
+    if _DIGIT_RE.search(line) is None:
         return None
     
-    # Skip lines that are clearly not test results
-    if not re.search(r'[a-zA-Z]', line) or not re.search(r'\d', line):
+    fields = _parse_line_fields(line)
+    if fields is None:
         return None
     
-    # Define regex patterns for different lab report formats
-    patterns = [
-        # Pattern 1: <name> <value> <unit>
-        # Example: "WBC 7.2 10^3/µL" or "White Blood Cells 7.2 10^3/µL" or "CO2 25 mmol/L"
-        r'^([A-Za-z0-9][A-Za-z0-9\s\-]*?)\s+([\d.]+)\s+([A-Za-z0-9/^µ%°\-\+]+)$',
+    test_name_raw, value, unit = fields
+    return {
+        "test_name_raw": test_name_raw,
+        "value": value,
+        "unit": unit
+    }
+
+
+@lru_cache(maxsize=1024)
+def _parse_line_fields(line: str) -> Optional[Tuple[str, float, str]]:
+    """
+    Extract (test_name_raw, value, unit) from a stripped line.
+    
+    OCR output repeats the same lines across reports, so results are
+    memoized; _parse_line builds a fresh dictionary from them per call.
+    
+    Args:
+        line: Single stripped line of text from OCR output, containing a digit
         
-        # Pattern 2: <name>: <value> <unit>
-        # Example: "Glucose: 95 mg/dL" or "CO2: 25 mmol/L"
-        r'^([A-Za-z0-9][A-Za-z0-9\s\-]*?):\s*([\d.]+)\s+([A-Za-z0-9/^µ%°\-\+]+)$',
+    Returns:
+        Tuple of test name, value and unit, or None if no supported test matches
+    """
+    if len(line) < 3:
+        return None
+    
+    # Skip lines that are clearly not test results
+    if _LETTER_RE.search(line) is None:
+        return None
+    
+    for groups in _iter_line_groups(line):
+        test_name_raw = groups[0].strip()
         
-        # Pattern 3: <name> <value><unit> (no space between value and unit)
-        # Example: "Hemoglobin 14.5g/dL"
-        r'^([A-Za-z0-9][A-Za-z0-9\s\-]*?)\s+([\d.]+)([A-Za-z0-9/^µ%°\-\+]+)$',
+        # Extract value
+        try:
+            value = float(groups[1])
+        except (ValueError, IndexError):
+            continue
         
-        # Pattern 4: <name>: <value> (no unit)
-        # Example: "Hematocrit: 42.5" or "CO2: 25"
-        r'^([A-Za-z0-9][A-Za-z0-9\s\-]*?):\s*([\d.]+)\s*$',
+        # Extract unit (if present)
+        unit = ""
+        if len(groups) > 2 and groups[2]:
+            unit = groups[2].strip()
         
-        # Pattern 5: <name> <value> (no unit, space separated)
-        # Example: "Platelets 250" or "CO2 25"
-        r'^([A-Za-z0-9][A-Za-z0-9\s\-]*?)\s+([\d.]+)\s*$',
+        # Normalize test name for filtering
+        normalized_name = normalize_test_name(test_name_raw)
         
-        # Pattern 6: Table format with multiple spaces/tabs
-        # Example: "WBC    7.2    10^3/µL"
-        r'^([A-Za-z0-9][A-Za-z0-9\s\-]*?)\s{2,}([\d.]+)\s{2,}([A-Za-z0-9/^µ%°\-\+]+)$',
+        # Only return if this looks like a supported test
+        if _is_supported_test(normalized_name):
+            return (test_name_raw, value, unit)
+    
+    return None
+
+
+def _iter_line_groups(line: str) -> Iterator[Tuple[str, ...]]:
+    """
+    Yield the capture groups of every line pattern that matches, in priority order.
+    
+    The combined pattern finds the first match in one scan; later patterns are
+    only tried when that match is rejected (bad value or unsupported test).
+    
+    Args:
+        line: Single stripped line of text from OCR output
         
-        # Pattern 7: Table format with tabs
-        # Example: "WBC\t7.2\t10^3/µL"
-        r'^([A-Za-z0-9][A-Za-z0-9\s\-]*?)\t+([\d.]+)\t+([A-Za-z0-9/^µ%°\-\+]+)$',
-    ]
+    Yields:
+        Tuple of (name, value[, unit]) capture groups
+    """
+    match = _LINE_RE.match(line)
+    if match is None:
+        return
     
-    for pattern in patterns:
-        match = re.match(pattern, line)
-        if match:
-            groups = match.groups()
-            test_name_raw = groups[0].strip()
-            
-            # Extract value
-            try:
-                value = float(groups[1])
-            except (ValueError, IndexError):
-                continue
-            
-            # Extract unit (if present)
-            unit = ""
-            if len(groups) > 2 and groups[2]:
-                unit = groups[2].strip()
-            
-            # Normalize test name for filtering
-            normalized_name = normalize_test_name(test_name_raw)
-            
-            # Only return if this looks like a supported test
-            if _is_supported_test(normalized_name):
-                return {
-                    "test_name_raw": test_name_raw,
-                    "value": value,
-                    "unit": unit
-                }
+    index, groups = _LINE_ALTERNATIVES[match.lastindex]
+    yield match.groups()[groups]
     
-    return None
+    for pattern in _LINE_PATTERNS[index + 1:]:
+        match = pattern.match(line)
+        if match:
+            yield match.groups()
 
 
+@lru_cache(maxsize=1024)
 def _is_supported_test(normalized_name: str) -> bool:
     """
     Check if a normalized test name belongs to one of the supported panels.
@@ -213,88 +351,12 @@ def _is_supported_test(normalized_name: str) -> bool:
     # Ensure the name is normalized (lowercase)
     normalized_name = normalized_name.lower().strip()
     
-    # Keywords for CBC tests
-    cbc_keywords = [
-        'wbc', 'white blood', 'leukocyte',
-        'rbc', 'red blood', 'erythrocyte',
-        'hemoglobin', 'haemoglobin', 'hgb', 'hb',
-        'hematocrit', 'haematocrit', 'hct',
-        'platelet', 'plt', 'thrombocyte',
-        'mcv', 'mean corpuscular', 'mean cell volume'
-    ]
-    
-    # Keywords for Metabolic Panel tests
-    metabolic_keywords = [
-        'glucose', 'glu', 'blood sugar', 'fasting glucose',
-        'bun', 'urea nitrogen', 'urea',
-        'creatinine', 'creat',
-        'sodium', 'na',
-        'potassium', 'k',
-        'chloride', 'cl',
-        'co2', 'carbon dioxide', 'bicarbonate', 'hco3',
-        'calcium'  # Removed 'ca' to avoid false positives with 'hba1c'
-    ]
-    
-    # Keywords for Lipid Panel tests
-    lipid_keywords = [
-        'cholesterol', 'chol',
-        'ldl', 'low density',
-        'hdl', 'high density',
-        'triglyceride', 'trig', 'tg'
-    ]
-    
-    # Combine all keywords
-    all_keywords = cbc_keywords + metabolic_keywords + lipid_keywords
-    
-    # Check if any keyword is in the normalized name
-    for keyword in all_keywords:
-        if keyword in normalized_name:
-            # Found a match, but need to check for explicitly unsupported tests
-            # that might contain the same substring
-            # These are common tests that might partially match supported keywords
-            unsupported_tests = [
-                'hba1c', 'a1c', 'hemoglobin a1c',  # Diabetes test (contains 'hb')
-                'vitamin', 'vit',
-                'tsh', 'thyroid',
-                't3', 't4',
-                'ferritin',
-                'b12', 'cobalamin',
-                'folate', 'folic acid',
-                'psa', 'prostate',
-                'crp', 'c-reactive',
-                'albumin',
-                'bilirubin',
-                'alt', 'ast', 'alp',  # Liver enzymes
-                'ggt',
-                'protein',
-                'magnesium', 'mg',
-                'phosphorus', 'phosphate'
-            ]
-            
-            # Check if this is an explicitly unsupported test
-            # Use word boundaries for short abbreviations to avoid false matches
-            is_unsupported = False
-            
-            # Short abbreviations that need word boundary checks
-            short_abbrevs = ['alt', 'ast', 'alp', 'mg', 'na', 'k']
-            
-            for unsupported in unsupported_tests:
-                # For short abbreviations, use word boundaries
-                if unsupported in short_abbrevs:
-                    import re
-                    if re.search(r'\b' + re.escape(unsupported) + r'\b', normalized_name):
-                        is_unsupported = True
-                        break
-                else:
-                    # For longer terms, simple substring match is fine
-                    if unsupported in normalized_name:
-                        is_unsupported = True
-                        break
-            
-            if not is_unsupported:
-                return True
-    
-    return False
+    # A supported keyword must appear, and the name must not be an explicitly
+    # unsupported test that happens to share a substring (e.g. 'hba1c' and 'hb')
+    return (
+        _SUPPORTED_KEYWORD_RE.search(normalized_name) is not None
+        and _UNSUPPORTED_TEST_RE.search(normalized_name) is None
+    )
 
 
 def get_supported_test_keywords() -> Dict[str, List[str]]:
@@ -304,31 +366,6 @@ def get_supported_test_keywords() -> Dict[str, List[str]]:
     This is useful for documentation and testing purposes.
     
     Returns:
-        Dictionary mapping panel names to lists of keywords
+        Dictionary mapping panel names to new lists of keywords
     """
-    return {
-        "CBC": [
-            'wbc', 'white blood', 'leukocyte',
-            'rbc', 'red blood', 'erythrocyte',
-            'hemoglobin', 'haemoglobin', 'hgb', 'hb',
-            'hematocrit', 'haematocrit', 'hct',
-            'platelet', 'plt', 'thrombocyte',
-            'mcv', 'mean corpuscular', 'mean cell volume'
-        ],
-        "METABOLIC": [
-            'glucose', 'glu', 'blood sugar',
-            'bun', 'urea nitrogen', 'urea',
-            'creatinine', 'creat',
-            'sodium', 'na',
-            'potassium', 'k',
-            'chloride', 'cl',
-            'co2', 'carbon dioxide', 'bicarbonate', 'hco3',
-            'calcium', 'ca'
-        ],
-        "LIPID": [
-            'cholesterol', 'chol',
-            'ldl', 'low density',
-            'hdl', 'high density',
-            'triglyceride', 'trig', 'tg'
-        ]
-    }
+    return {panel: list(keywords) for panel, keywords in _SUPPORTED_TEST_KEYWORDS.items()}
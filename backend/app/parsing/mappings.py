@@ -5,7 +5,9 @@ This module provides functionality to map raw test names from OCR output
 to canonical TestType records using the TestAlias table.
 """
 
-from sqlalchemy.orm import Session
+from typing import List, Optional, Sequence
+
+from sqlalchemy.orm import Session, joinedload
 from app.db.models import TestAlias, TestType
 
 
@@ -55,3 +57,36 @@ def map_test_name_to_type(
     if alias:
         return alias.test_type
     return None
+
+
+def map_test_names_to_types(
+    db: Session,
+    raw_names: Sequence[str]
+) -> List[Optional[TestType]]:
+    """
+    Map many raw test names to canonical TestTypes with a single query.
+    
+    Equivalent to calling map_test_name_to_type() for each name, but all
+    matching aliases are fetched in one SELECT and resolved through a dict,
+    instead of one query per parsed test.
+    
+    Args:
+        db: SQLAlchemy database session
+        raw_names: Raw test names extracted from OCR output
+        
+    Returns:
+        List aligned with raw_names containing the TestType for each name,
+        or None where no alias matched
+    """
+    normalized_names = [raw_name.strip().lower() for raw_name in raw_names]
+    
+    lookup = {name for name in normalized_names if name}
+    if not lookup:
+        return [None] * len(normalized_names)
+    
+    aliases = db.query(TestAlias).options(
+        joinedload(TestAlias.test_type)
+    ).filter(TestAlias.alias.in_(lookup)).all()
+    test_types_by_alias = {alias.alias: alias.test_type for alias in aliases}
+    
+    return [test_types_by_alias.get(name) for name in normalized_names]
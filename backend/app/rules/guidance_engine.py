@@ -8,16 +8,55 @@ All guidance includes prominent disclaimers that information is educational only
 and not a medical diagnosis.
 """
 
-from typing import Optional, Dict, List
+from collections import defaultdict
+from typing import NamedTuple, Optional, Dict, List, Tuple
 from app.db.models import TestType
 
 
+# Always-included medical disclaimer
+_DISCLAIMER = (
+    "This is general educational information and NOT a medical diagnosis. "
+    "Please consult a qualified doctor for medical advice and clinical decisions."
+)
+
+_DEFAULT_SUGGESTIONS = ("Consult your doctor for interpretation of this result.",)
+
+_NO_MESSAGES: Dict[str, str] = {}
+
+# Trend codes produced by _trend_code(), indexed into _TREND_LABELS
+_TREND_STABLE = 0
+_TREND_IMPROVING = 1
+_TREND_WORSENING = 2
+_TREND_NONE = 3
+_TREND_LABELS = ("stable", "improving", "worsening", None)
+
+_LOW_STATUSES = frozenset({"LOW", "CRITICAL_LOW"})
+_HIGH_STATUSES = frozenset({"HIGH", "CRITICAL_HIGH"})
+
+
+class Guidance(NamedTuple):
+    """Educational guidance for a single test result."""
+    message: str                   # Educational message about the test
+    trend: Optional[str]           # 'improving', 'worsening', 'stable', or None
+    suggestions: Tuple[str, ...]   # General suggestions (shared constant tuples)
+    disclaimer: str                # Medical disclaimer
+
+    def to_dict(self) -> Dict:
+        """Return the guidance as a JSON-ready dictionary for API responses."""
+        return {
+            "message": self.message,
+            "trend": self.trend,
+            "suggestions": list(self.suggestions),
+            "disclaimer": self.disclaimer,
+        }
+
+
 def generate_guidance(
     test_type: TestType,
     value: float,
     status: str,
     previous_value: Optional[float] = None
-) -> Dict:
+) -> Guidance:
     """
     Generate educational guidance for a test result.
     
@@ -28,46 +67,88 @@ def generate_guidance(
         previous_value: Optional previous test result value for trend computation
     
     Returns:
-        Dictionary containing:
-        {
-            "message": str,              # Educational message about the test
-            "trend": str | None,         # 'improving', 'worsening', 'stable', or None
-            "suggestions": list[str],    # List of general suggestions
-            "disclaimer": str            # Medical disclaimer
-        }
+        Guidance with message, trend, suggestions and disclaimer.
+        Use Guidance.to_dict() to serialize it for API responses.
     
     """
+    panel_key = test_type.panel.key
+    
+    # Fast path: first result for a test outside the supported panels
+    if previous_value is None and panel_key not in _PANEL_GUIDANCE:
+        return Guidance(
+            f"This test measures {test_type.display_name}.",
+            None,
+            _DEFAULT_SUGGESTIONS,
+            _DISCLAIMER
+        )
+    
     # Compute trend indicator when previous result exists
     trend = _compute_trend(test_type, value, status, previous_value)
     
     # Generate panel-specific messages
-    panel_key = test_type.panel.key
-    
-    if panel_key == "CBC":
-        message = _generate_cbc_message(test_type, status)
-        suggestions = _generate_cbc_suggestions(test_type, status)
-    elif panel_key == "METABOLIC":
-        message = _generate_metabolic_message(test_type, status)
-        suggestions = _generate_metabolic_suggestions(test_type, status)
-    elif panel_key == "LIPID":
-        message = _generate_lipid_message(test_type, status)
-        suggestions = _generate_lipid_suggestions(test_type, status)
+    handlers = _PANEL_GUIDANCE.get(panel_key)
+    if handlers is not None:
+        _, message_fn, suggestions_fn = handlers
+        message = message_fn(test_type, status)
+        suggestions = suggestions_fn(test_type, status)
     else:
         message = f"This test measures {test_type.display_name}."
-        suggestions = ["Consult your doctor for interpretation of this result."]
+        suggestions = _DEFAULT_SUGGESTIONS
     
     # Always include disclaimer
-    disclaimer = (
-        "This is general educational information and NOT a medical diagnosis. "
-        "Please consult a qualified doctor for medical advice and clinical decisions."
-    )
+    return Guidance(message, trend, suggestions, _DISCLAIMER)
+
+
+def generate_guidance_bulk(
+    rows: List[Tuple[TestType, float, str, Optional[float]]]
+) -> List[Guidance]:
+    """
+    Generate educational guidance for many test results at once.
+    
+    Rows are grouped by panel so the panel dispatch happens once per group
+    instead of once per row. Results are identical to calling
+    generate_guidance() for each row.
     
-    return {
-        "message": message,
-        "trend": trend,
-        "suggestions": suggestions,
-        "disclaimer": disclaimer
-    }
+    Args:
+        rows: List of (test_type, value, status, previous_value) tuples
+    
+    Returns:
+        List of Guidance objects in the same order as the input rows
+    """
+    groups = defaultdict(list)
+    for index, row in enumerate(rows):
+        groups[row[0].panel.key].append(index)
+    
+    out: List[Optional[Guidance]] = [None] * len(rows)
+    
+    for panel_key, indices in groups.items():
+        handlers = _PANEL_GUIDANCE.get(panel_key)
+        
+        if handlers is None:
+            for index in indices:
+                test_type, value, status, previous_value = rows[index]
+                out[index] = Guidance(
+                    f"This test measures {test_type.display_name}.",
+                    _compute_trend(test_type, value, status, previous_value),
+                    _DEFAULT_SUGGESTIONS,
+                    _DISCLAIMER
+                )
+            continue
+        
+        messages, message_fn, suggestions_fn = handlers
+        for index in indices:
+            test_type, value, status, previous_value = rows[index]
+            message = messages.get(test_type.key, _NO_MESSAGES).get(status)
+            if message is None:
+                message = message_fn(test_type, status)
+            out[index] = Guidance(
+                message,
+                _compute_trend(test_type, value, status, previous_value),
+                suggestions_fn(test_type, status),
+                _DISCLAIMER
+            )
+    
+    return out
 
 
 def _compute_trend(
@@ -96,25 +177,49 @@ def _compute_trend(
     if previous_value is None:
         return None
     
+    code = _trend_code(test_type.ref_low, test_type.ref_high, current_value, previous_value)
+    return _TREND_LABELS[code]
+
+
+def _trend_code(
+    ref_low: Optional[float],
+    ref_high: Optional[float],
+    current_value: float,
+    previous_value: float
+) -> int:
+    """
+    Classify the change between two values as an integer trend code.
+    
+    Works on plain numbers only (no ORM attribute access) so callers can
+    read the reference range once and reuse it across many values.
+    
+    Returns:
+        _TREND_STABLE, _TREND_IMPROVING, _TREND_WORSENING or _TREND_NONE;
+        use _TREND_LABELS to translate the code to its string label
+    """
+    # Magnitudes are compared squared to avoid abs() calls
+    change = current_value - previous_value
+    change_sq = change * change
+    
     # If no reference ranges, we can't determine improvement direction
-    if test_type.ref_low is None or test_type.ref_high is None:
+    if ref_low is None or ref_high is None:
         # Just check if values are similar
-        if abs(current_value - previous_value) < abs(current_value * 0.05):
-            return "stable"
-        return None
+        relative_threshold = current_value * 0.05
+        if change_sq < relative_threshold * relative_threshold:
+            return _TREND_STABLE
+        return _TREND_NONE
     
     # Calculate 5% of reference range as threshold for "stable"
-    range_width = test_type.ref_high - test_type.ref_low
-    stability_threshold = range_width * 0.05
+    stability_threshold = (ref_high - ref_low) * 0.05
     
     # Check if change is minimal (stable)
-    if abs(current_value - previous_value) < stability_threshold:
-        return "stable"
+    if stability_threshold > 0 and change_sq < stability_threshold * stability_threshold:
+        return _TREND_STABLE
     
     # Determine if improving or worsening based on movement toward/away from normal
-    is_improving = _is_improving(test_type, current_value, previous_value, current_status)
-    
-    return "improving" if is_improving else "worsening"
+    if _is_closer_to_midpoint(ref_low, ref_high, current_value, previous_value):
+        return _TREND_IMPROVING
+    return _TREND_WORSENING
 
 
 def _is_improving(
@@ -138,15 +243,74 @@ def _is_improving(
     if test_type.ref_low is None or test_type.ref_high is None:
         return False
     
+    return _is_closer_to_midpoint(
+        test_type.ref_low, test_type.ref_high, current_value, previous_value
+    )
+
+
+def _is_closer_to_midpoint(
+    ref_low: float,
+    ref_high: float,
+    current_value: float,
+    previous_value: float
+) -> bool:
+    """Check whether current_value is closer to the range midpoint than previous_value."""
     # Calculate midpoint of normal range
-    normal_midpoint = (test_type.ref_low + test_type.ref_high) / 2
+    normal_midpoint = (ref_low + ref_high) / 2
     
-    # Calculate distances from normal midpoint
-    current_distance = abs(current_value - normal_midpoint)
-    previous_distance = abs(previous_value - normal_midpoint)
+    # Calculate (squared) distances from normal midpoint
+    current_offset = current_value - normal_midpoint
+    previous_offset = previous_value - normal_midpoint
     
     # Improving if current value is closer to normal midpoint than previous
-    return current_distance < previous_distance
+    return current_offset * current_offset < previous_offset * previous_offset
+
+
+# General information about blood cell levels for CBC tests
+_CBC_MESSAGES = {
+    "WBC": {
+        "NORMAL": "White blood cells (WBC) help fight infections. Your level is within the normal range.",
+        "LOW": "White blood cells (WBC) help fight infections. A low count may affect your immune system's ability to fight infections.",
+        "HIGH": "White blood cells (WBC) help fight infections. An elevated count may indicate your body is responding to an infection or inflammation.",
+        "CRITICAL_LOW": "White blood cells (WBC) help fight infections. A very low count significantly affects immune function.",
+        "CRITICAL_HIGH": "White blood cells (WBC) help fight infections. A very high count requires medical attention.",
+    },
+    "RBC": {
+        "NORMAL": "Red blood cells (RBC) carry oxygen throughout your body. Your level is within the normal range.",
+        "LOW": "Red blood cells (RBC) carry oxygen throughout your body. A low count may lead to fatigue and weakness.",
+        "HIGH": "Red blood cells (RBC) carry oxygen throughout your body. An elevated count may affect blood flow.",
+        "CRITICAL_LOW": "Red blood cells (RBC) carry oxygen throughout your body. A very low count can cause severe symptoms.",
+        "CRITICAL_HIGH": "Red blood cells (RBC) carry oxygen throughout your body. A very high count requires medical attention.",
+    },
+    "HGB": {
+        "NORMAL": "Hemoglobin carries oxygen in your blood. Your level is within the normal range.",
+        "LOW": "Hemoglobin carries oxygen in your blood. Low levels may indicate anemia and can cause fatigue.",
+        "HIGH": "Hemoglobin carries oxygen in your blood. Elevated levels may affect blood thickness.",
+        "CRITICAL_LOW": "Hemoglobin carries oxygen in your blood. Very low levels require immediate attention.",
+        "CRITICAL_HIGH": "Hemoglobin carries oxygen in your blood. Very high levels require medical attention.",
+    },
+    "HCT": {
+        "NORMAL": "Hematocrit measures the proportion of blood made up of red blood cells. Your level is within the normal range.",
+        "LOW": "Hematocrit measures the proportion of blood made up of red blood cells. Low levels may indicate anemia.",
+        "HIGH": "Hematocrit measures the proportion of blood made up of red blood cells. High levels may affect blood flow.",
+        "CRITICAL_LOW": "Hematocrit measures the proportion of blood made up of red blood cells. Very low levels require attention.",
+        "CRITICAL_HIGH": "Hematocrit measures the proportion of blood made up of red blood cells. Very high levels require medical attention.",
+    },
+    "PLT": {
+        "NORMAL": "Platelets help your blood clot. Your level is within the normal range.",
+        "LOW": "Platelets help your blood clot. Low counts may increase bleeding risk.",
+        "HIGH": "Platelets help your blood clot. High counts may affect blood clotting.",
+        "CRITICAL_LOW": "Platelets help your blood clot. Very low counts significantly increase bleeding risk.",
+        "CRITICAL_HIGH": "Platelets help your blood clot. Very high counts require medical attention.",
+    },
+    "MCV": {
+        "NORMAL": "Mean Corpuscular Volume (MCV) measures the average size of your red blood cells. Your level is within the normal range.",
+        "LOW": "Mean Corpuscular Volume (MCV) measures the average size of your red blood cells. Small cells may indicate certain types of anemia.",
+        "HIGH": "Mean Corpuscular Volume (MCV) measures the average size of your red blood cells. Large cells may indicate vitamin deficiencies.",
+        "CRITICAL_LOW": "Mean Corpuscular Volume (MCV) measures the average size of your red blood cells. Very small cells require evaluation.",
+        "CRITICAL_HIGH": "Mean Corpuscular Volume (MCV) measures the average size of your red blood cells. Very large cells require evaluation.",
+    },
+}
 
 
 def _generate_cbc_message(test_type: TestType, status: str) -> str:
@@ -157,132 +321,121 @@ def _generate_cbc_message(test_type: TestType, status: str) -> str:
     """
     test_key = test_type.key
     
-    # General information about blood cell levels for CBC tests
-    messages = {
-        "WBC": {
-            "NORMAL": "White blood cells (WBC) help fight infections. Your level is within the normal range.",
-            "LOW": "White blood cells (WBC) help fight infections. A low count may affect your immune system's ability to fight infections.",
-            "HIGH": "White blood cells (WBC) help fight infections. An elevated count may indicate your body is responding to an infection or inflammation.",
-            "CRITICAL_LOW": "White blood cells (WBC) help fight infections. A very low count significantly affects immune function.",
-            "CRITICAL_HIGH": "White blood cells (WBC) help fight infections. A very high count requires medical attention.",
-        },
-        "RBC": {
-            "NORMAL": "Red blood cells (RBC) carry oxygen throughout your body. Your level is within the normal range.",
-            "LOW": "Red blood cells (RBC) carry oxygen throughout your body. A low count may lead to fatigue and weakness.",
-            "HIGH": "Red blood cells (RBC) carry oxygen throughout your body. An elevated count may affect blood flow.",
-            "CRITICAL_LOW": "Red blood cells (RBC) carry oxygen throughout your body. A very low count can cause severe symptoms.",
-            "CRITICAL_HIGH": "Red blood cells (RBC) carry oxygen throughout your body. A very high count requires medical attention.",
-        },
-        "HGB": {
-            "NORMAL": "Hemoglobin carries oxygen in your blood. Your level is within the normal range.",
-            "LOW": "Hemoglobin carries oxygen in your blood. Low levels may indicate anemia and can cause fatigue.",
-            "HIGH": "Hemoglobin carries oxygen in your blood. Elevated levels may affect blood thickness.",
-            "CRITICAL_LOW": "Hemoglobin carries oxygen in your blood. Very low levels require immediate attention.",
-            "CRITICAL_HIGH": "Hemoglobin carries oxygen in your blood. Very high levels require medical attention.",
-        },
-        "HCT": {
-            "NORMAL": "Hematocrit measures the proportion of blood made up of red blood cells. Your level is within the normal range.",
-            "LOW": "Hematocrit measures the proportion of blood made up of red blood cells. Low levels may indicate anemia.",
-            "HIGH": "Hematocrit measures the proportion of blood made up of red blood cells. High levels may affect blood flow.",
-            "CRITICAL_LOW": "Hematocrit measures the proportion of blood made up of red blood cells. Very low levels require attention.",
-            "CRITICAL_HIGH": "Hematocrit measures the proportion of blood made up of red blood cells. Very high levels require medical attention.",
-        },
-        "PLT": {
-            "NORMAL": "Platelets help your blood clot. Your level is within the normal range.",
-            "LOW": "Platelets help your blood clot. Low counts may increase bleeding risk.",
-            "HIGH": "Platelets help your blood clot. High counts may affect blood clotting.",
-            "CRITICAL_LOW": "Platelets help your blood clot. Very low counts significantly increase bleeding risk.",
-            "CRITICAL_HIGH": "Platelets help your blood clot. Very high counts require medical attention.",
-        },
-        "MCV": {
-            "NORMAL": "Mean Corpuscular Volume (MCV) measures the average size of your red blood cells. Your level is within the normal range.",
-            "LOW": "Mean Corpuscular Volume (MCV) measures the average size of your red blood cells. Small cells may indicate certain types of anemia.",
-            "HIGH": "Mean Corpuscular Volume (MCV) measures the average size of your red blood cells. Large cells may indicate vitamin deficiencies.",
-            "CRITICAL_LOW": "Mean Corpuscular Volume (MCV) measures the average size of your red blood cells. Very small cells require evaluation.",
-            "CRITICAL_HIGH": "Mean Corpuscular Volume (MCV) measures the average size of your red blood cells. Very large cells require evaluation.",
-        },
-    }
-    
-    if test_key in messages and status in messages[test_key]:
-        return messages[test_key][status]
+    if test_key in _CBC_MESSAGES and status in _CBC_MESSAGES[test_key]:
+        return _CBC_MESSAGES[test_key][status]
     
     # Fallback message
     return f"{test_type.display_name} is a measure of blood cell levels. Your result is {status}."
 
 
+# General information about organ function for metabolic tests
+_METABOLIC_MESSAGES = {
+    "GLUCOSE": {
+        "NORMAL": "Glucose is your blood sugar level. Your level is within the normal range.",
+        "LOW": "Glucose is your blood sugar level. Low levels can cause symptoms like shakiness and confusion.",
+        "HIGH": "Glucose is your blood sugar level. Elevated levels may indicate prediabetes or diabetes.",
+        "CRITICAL_LOW": "Glucose is your blood sugar level. Very low levels require immediate attention.",
+        "CRITICAL_HIGH": "Glucose is your blood sugar level. Very high levels require medical attention.",
+    },
+    "BUN": {
+        "NORMAL": "Blood Urea Nitrogen (BUN) reflects kidney function. Your level is within the normal range.",
+        "LOW": "Blood Urea Nitrogen (BUN) reflects kidney function. Low levels are usually not concerning.",
+        "HIGH": "Blood Urea Nitrogen (BUN) reflects kidney function. Elevated levels may indicate kidney stress or dehydration.",
+        "CRITICAL_LOW": "Blood Urea Nitrogen (BUN) reflects kidney function. Very low levels may need evaluation.",
+        "CRITICAL_HIGH": "Blood Urea Nitrogen (BUN) reflects kidney function. Very high levels require medical attention.",
+    },
+    "CREATININE": {
+        "NORMAL": "Creatinine is a waste product filtered by your kidneys. Your level is within the normal range.",
+        "LOW": "Creatinine is a waste product filtered by your kidneys. Low levels are usually not concerning.",
+        "HIGH": "Creatinine is a waste product filtered by your kidneys. Elevated levels may indicate reduced kidney function.",
+        "CRITICAL_LOW": "Creatinine is a waste product filtered by your kidneys. Very low levels may need evaluation.",
+        "CRITICAL_HIGH": "Creatinine is a waste product filtered by your kidneys. Very high levels require medical attention.",
+    },
+    "SODIUM": {
+        "NORMAL": "Sodium is an electrolyte that helps regulate fluid balance. Your level is within the normal range.",
+        "LOW": "Sodium is an electrolyte that helps regulate fluid balance. Low levels can cause confusion and weakness.",
+        "HIGH": "Sodium is an electrolyte that helps regulate fluid balance. High levels may indicate dehydration.",
+        "CRITICAL_LOW": "Sodium is an electrolyte that helps regulate fluid balance. Very low levels require immediate attention.",
+        "CRITICAL_HIGH": "Sodium is an electrolyte that helps regulate fluid balance. Very high levels require medical attention.",
+    },
+    "POTASSIUM": {
+        "NORMAL": "Potassium is essential for heart and muscle function. Your level is within the normal range.",
+        "LOW": "Potassium is essential for heart and muscle function. Low levels can affect heart rhythm and muscle strength.",
+        "HIGH": "Potassium is essential for heart and muscle function. High levels can affect heart rhythm.",
+        "CRITICAL_LOW": "Potassium is essential for heart and muscle function. Very low levels require immediate attention.",
+        "CRITICAL_HIGH": "Potassium is essential for heart and muscle function. Very high levels require immediate attention.",
+    },
+    "CHLORIDE": {
+        "NORMAL": "Chloride is an electrolyte that helps maintain fluid balance. Your level is within the normal range.",
+        "LOW": "Chloride is an electrolyte that helps maintain fluid balance. Low levels may indicate fluid imbalances.",
+        "HIGH": "Chloride is an electrolyte that helps maintain fluid balance. High levels may indicate dehydration.",
+        "CRITICAL_LOW": "Chloride is an electrolyte that helps maintain fluid balance. Very low levels require evaluation.",
+        "CRITICAL_HIGH": "Chloride is an electrolyte that helps maintain fluid balance. Very high levels require evaluation.",
+    },
+    "CO2": {
+        "NORMAL": "CO2 (bicarbonate) helps maintain your body's pH balance. Your level is within the normal range.",
+        "LOW": "CO2 (bicarbonate) helps maintain your body's pH balance. Low levels may indicate metabolic acidosis.",
+        "HIGH": "CO2 (bicarbonate) helps maintain your body's pH balance. High levels may indicate metabolic alkalosis.",
+        "CRITICAL_LOW": "CO2 (bicarbonate) helps maintain your body's pH balance. Very low levels require medical attention.",
+        "CRITICAL_HIGH": "CO2 (bicarbonate) helps maintain your body's pH balance. Very high levels require medical attention.",
+    },
+    "CALCIUM": {
+        "NORMAL": "Calcium is important for bone health and muscle function. Your level is within the normal range.",
+        "LOW": "Calcium is important for bone health and muscle function. Low levels can affect bones and muscles.",
+        "HIGH": "Calcium is important for bone health and muscle function. High levels may indicate various conditions.",
+        "CRITICAL_LOW": "Calcium is important for bone health and muscle function. Very low levels require medical attention.",
+        "CRITICAL_HIGH": "Calcium is important for bone health and muscle function. Very high levels require medical attention.",
+    },
+}
+
+
 def _generate_metabolic_message(test_type: TestType, status: str) -> str:
     """
     Generate Metabolic Panel-specific educational messages about organ function.
     """
     test_key = test_type.key
     
-    # General information about organ function for metabolic tests
-    messages = {
-        "GLUCOSE": {
-            "NORMAL": "Glucose is your blood sugar level. Your level is within the normal range.",
-            "LOW": "Glucose is your blood sugar level. Low levels can cause symptoms like shakiness and confusion.",
-            "HIGH": "Glucose is your blood sugar level. Elevated levels may indicate prediabetes or diabetes.",
-            "CRITICAL_LOW": "Glucose is your blood sugar level. Very low levels require immediate attention.",
-            "CRITICAL_HIGH": "Glucose is your blood sugar level. Very high levels require medical attention.",
-        },
-        "BUN": {
-            "NORMAL": "Blood Urea Nitrogen (BUN) reflects kidney function. Your level is within the normal range.",
-            "LOW": "Blood Urea Nitrogen (BUN) reflects kidney function. Low levels are usually not concerning.",
-            "HIGH": "Blood Urea Nitrogen (BUN) reflects kidney function. Elevated levels may indicate kidney stress or dehydration.",
-            "CRITICAL_LOW": "Blood Urea Nitrogen (BUN) reflects kidney function. Very low levels may need evaluation.",
-            "CRITICAL_HIGH": "Blood Urea Nitrogen (BUN) reflects kidney function. Very high levels require medical attention.",
-        },
-        "CREATININE": {
-            "NORMAL": "Creatinine is a waste product filtered by your kidneys. Your level is within the normal range.",
-            "LOW": "Creatinine is a waste product filtered by your kidneys. Low levels are usually not concerning.",
-            "HIGH": "Creatinine is a waste product filtered by your kidneys. Elevated levels may indicate reduced kidney function.",
-            "CRITICAL_LOW": "Creatinine is a waste product filtered by your kidneys. Very low levels may need evaluation.",
-            "CRITICAL_HIGH": "Creatinine is a waste product filtered by your kidneys. Very high levels require medical attention.",
-        },
-        "SODIUM": {
-            "NORMAL": "Sodium is an electrolyte that helps regulate fluid balance. Your level is within the normal range.",
-            "LOW": "Sodium is an electrolyte that helps regulate fluid balance. Low levels can cause confusion and weakness.",
-            "HIGH": "Sodium is an electrolyte that helps regulate fluid balance. High levels may indicate dehydration.",
-            "CRITICAL_LOW": "Sodium is an electrolyte that helps regulate fluid balance. Very low levels require immediate attention.",
-            "CRITICAL_HIGH": "Sodium is an electrolyte that helps regulate fluid balance. Very high levels require medical attention.",
-        },
-        "POTASSIUM": {
-            "NORMAL": "Potassium is essential for heart and muscle function. Your level is within the normal range.",
-            "LOW": "Potassium is essential for heart and muscle function. Low levels can affect heart rhythm and muscle strength.",
-            "HIGH": "Potassium is essential for heart and muscle function. High levels can affect heart rhythm.",
-            "CRITICAL_LOW": "Potassium is essential for heart and muscle function. Very low levels require immediate attention.",
-            "CRITICAL_HIGH": "Potassium is essential for heart and muscle function. Very high levels require immediate attention.",
-        },
-        "CHLORIDE": {
-            "NORMAL": "Chloride is an electrolyte that helps maintain fluid balance. Your level is within the normal range.",
-            "LOW": "Chloride is an electrolyte that helps maintain fluid balance. Low levels may indicate fluid imbalances.",
-            "HIGH": "Chloride is an electrolyte that helps maintain fluid balance. High levels may indicate dehydration.",
-            "CRITICAL_LOW": "Chloride is an electrolyte that helps maintain fluid balance. Very low levels require evaluation.",
-            "CRITICAL_HIGH": "Chloride is an electrolyte that helps maintain fluid balance. Very high levels require evaluation.",
-        },
-        "CO2": {
-            "NORMAL": "CO2 (bicarbonate) helps maintain your body's pH balance. Your level is within the normal range.",
-            "LOW": "CO2 (bicarbonate) helps maintain your body's pH balance. Low levels may indicate metabolic acidosis.",
-            "HIGH": "CO2 (bicarbonate) helps maintain your body's pH balance. High levels may indicate metabolic alkalosis.",
-            "CRITICAL_LOW": "CO2 (bicarbonate) helps maintain your body's pH balance. Very low levels require medical attention.",
-            "CRITICAL_HIGH": "CO2 (bicarbonate) helps maintain your body's pH balance. Very high levels require medical attention.",
-        },
-        "CALCIUM": {
-            "NORMAL": "Calcium is important for bone health and muscle function. Your level is within the normal range.",
-            "LOW": "Calcium is important for bone health and muscle function. Low levels can affect bones and muscles.",
-            "HIGH": "Calcium is important for bone health and muscle function. High levels may indicate various conditions.",
-            "CRITICAL_LOW": "Calcium is important for bone health and muscle function. Very low levels require medical attention.",
-            "CRITICAL_HIGH": "Calcium is important for bone health and muscle function. Very high levels require medical attention.",
-        },
-    }
-    
-    if test_key in messages and status in messages[test_key]:
-        return messages[test_key][status]
+    if test_key in _METABOLIC_MESSAGES and status in _METABOLIC_MESSAGES[test_key]:
+        return _METABOLIC_MESSAGES[test_key][status]
     
     # Fallback message
     return f"{test_type.display_name} is a measure of organ function. Your result is {status}."
 
 
+# General information about heart health risk factors for lipid tests
+_LIPID_MESSAGES = {
+    "TC": {
+        "NORMAL": "Total Cholesterol measures all cholesterol in your blood. Your level is within the desirable range.",
+        "LOW": "Total Cholesterol measures all cholesterol in your blood. Low levels are generally favorable for heart health.",
+        "HIGH": "Total Cholesterol measures all cholesterol in your blood. Elevated levels may increase cardiovascular risk.",
+        "CRITICAL_LOW": "Total Cholesterol measures all cholesterol in your blood. Very low levels may need evaluation.",
+        "CRITICAL_HIGH": "Total Cholesterol measures all cholesterol in your blood. Very high levels significantly increase cardiovascular risk.",
+    },
+    "LDL": {
+        "NORMAL": "LDL (\"bad\" cholesterol) can build up in arteries. Your level is within the optimal range.",
+        "LOW": "LDL (\"bad\" cholesterol) can build up in arteries. Low levels are favorable for heart health.",
+        "HIGH": "LDL (\"bad\" cholesterol) can build up in arteries. Elevated levels increase risk of heart disease.",
+        "CRITICAL_LOW": "LDL (\"bad\" cholesterol) can build up in arteries. Very low levels are generally not concerning.",
+        "CRITICAL_HIGH": "LDL (\"bad\" cholesterol) can build up in arteries. Very high levels significantly increase heart disease risk.",
+    },
+    "HDL": {
+        "NORMAL": "HDL (\"good\" cholesterol) helps remove cholesterol from arteries. Your level is within the protective range.",
+        "LOW": "HDL (\"good\" cholesterol) helps remove cholesterol from arteries. Low levels may increase cardiovascular risk.",
+        "HIGH": "HDL (\"good\" cholesterol) helps remove cholesterol from arteries. High levels are generally protective for heart health.",
+        "PROTECTIVE": "HDL (\"good\" cholesterol) helps remove cholesterol from arteries. Your level is excellent and provides strong protection against heart disease!",
+        "CRITICAL_LOW": "HDL (\"good\" cholesterol) helps remove cholesterol from arteries. Very low levels increase heart disease risk.",
+        "CRITICAL_HIGH": "HDL (\"good\" cholesterol) helps remove cholesterol from arteries. Very high levels are generally favorable.",
+    },
+    "TRIG": {
+        "NORMAL": "Triglycerides are a type of fat in your blood. Your level is within the normal range.",
+        "LOW": "Triglycerides are a type of fat in your blood. Low levels are generally not concerning.",
+        "HIGH": "Triglycerides are a type of fat in your blood. Elevated levels may increase cardiovascular risk.",
+        "CRITICAL_LOW": "Triglycerides are a type of fat in your blood. Very low levels are generally not concerning.",
+        "CRITICAL_HIGH": "Triglycerides are a type of fat in your blood. Very high levels significantly increase cardiovascular risk.",
+    },
+}
+
+
 def _generate_lipid_message(test_type: TestType, status: str) -> str:
     """
     Generate Lipid Panel-specific educational messages about heart health.
@@ -291,127 +444,102 @@ def _generate_lipid_message(test_type: TestType, status: str) -> str:
     """
     test_key = test_type.key
     
-    # General information about heart health risk factors for lipid tests
-    messages = {
-        "TC": {
-            "NORMAL": "Total Cholesterol measures all cholesterol in your blood. Your level is within the desirable range.",
-            "LOW": "Total Cholesterol measures all cholesterol in your blood. Low levels are generally favorable for heart health.",
-            "HIGH": "Total Cholesterol measures all cholesterol in your blood. Elevated levels may increase cardiovascular risk.",
-            "CRITICAL_LOW": "Total Cholesterol measures all cholesterol in your blood. Very low levels may need evaluation.",
-            "CRITICAL_HIGH": "Total Cholesterol measures all cholesterol in your blood. Very high levels significantly increase cardiovascular risk.",
-        },
-        "LDL": {
-            "NORMAL": "LDL (\"bad\" cholesterol) can build up in arteries. Your level is within the optimal range.",
-            "LOW": "LDL (\"bad\" cholesterol) can build up in arteries. Low levels are favorable for heart health.",
-            "HIGH": "LDL (\"bad\" cholesterol) can build up in arteries. Elevated levels increase risk of heart disease.",
-            "CRITICAL_LOW": "LDL (\"bad\" cholesterol) can build up in arteries. Very low levels are generally not concerning.",
-            "CRITICAL_HIGH": "LDL (\"bad\" cholesterol) can build up in arteries. Very high levels significantly increase heart disease risk.",
-        },
-        "HDL": {
-            "NORMAL": "HDL (\"good\" cholesterol) helps remove cholesterol from arteries. Your level is within the protective range.",
-            "LOW": "HDL (\"good\" cholesterol) helps remove cholesterol from arteries. Low levels may increase cardiovascular risk.",
-            "HIGH": "HDL (\"good\" cholesterol) helps remove cholesterol from arteries. High levels are generally protective for heart health.",
-            "PROTECTIVE": "HDL (\"good\" cholesterol) helps remove cholesterol from arteries. Your level is excellent and provides strong protection against heart disease!",
-            "CRITICAL_LOW": "HDL (\"good\" cholesterol) helps remove cholesterol from arteries. Very low levels increase heart disease risk.",
-            "CRITICAL_HIGH": "HDL (\"good\" cholesterol) helps remove cholesterol from arteries. Very high levels are generally favorable.",
-        },
-        "TRIG": {
-            "NORMAL": "Triglycerides are a type of fat in your blood. Your level is within the normal range.",
-            "LOW": "Triglycerides are a type of fat in your blood. Low levels are generally not concerning.",
-            "HIGH": "Triglycerides are a type of fat in your blood. Elevated levels may increase cardiovascular risk.",
-            "CRITICAL_LOW": "Triglycerides are a type of fat in your blood. Very low levels are generally not concerning.",
-            "CRITICAL_HIGH": "Triglycerides are a type of fat in your blood. Very high levels significantly increase cardiovascular risk.",
-        },
-    }
-    
-    if test_key in messages and status in messages[test_key]:
-        return messages[test_key][status]
+    if test_key in _LIPID_MESSAGES and status in _LIPID_MESSAGES[test_key]:
+        return _LIPID_MESSAGES[test_key][status]
     
     # Fallback message
     return f"{test_type.display_name} is a measure of heart health risk factors. Your result is {status}."
 
 
-def _generate_cbc_suggestions(test_type: TestType, status: str) -> List[str]:
+def _generate_cbc_suggestions(test_type: TestType, status: str) -> Tuple[str, ...]:
     """Generate general suggestions for CBC test results."""
-    if status in ["NORMAL"]:
-        return [
+    if status == "NORMAL":
+        return (
             "Continue maintaining a healthy lifestyle.",
             "Regular check-ups help monitor your health over time.",
-        ]
-    elif status in ["LOW", "CRITICAL_LOW"]:
-        return [
+        )
+    elif status in _LOW_STATUSES:
+        return (
             "Discuss this result with your doctor.",
             "Your doctor may recommend additional tests or evaluation.",
             "Follow your doctor's guidance for any necessary treatment.",
-        ]
-    elif status in ["HIGH", "CRITICAL_HIGH"]:
-        return [
+        )
+    elif status in _HIGH_STATUSES:
+        return (
             "Discuss this result with your doctor.",
             "Your doctor may recommend additional tests to determine the cause.",
             "Follow your doctor's guidance for any necessary treatment.",
-        ]
+        )
     else:
-        return ["Consult your doctor for interpretation of this result."]
+        return _DEFAULT_SUGGESTIONS
 
 
-def _generate_metabolic_suggestions(test_type: TestType, status: str) -> List[str]:
+def _generate_metabolic_suggestions(test_type: TestType, status: str) -> Tuple[str, ...]:
     """Generate general suggestions for Metabolic Panel test results."""
-    if status in ["NORMAL"]:
-        return [
+    if status == "NORMAL":
+        return (
             "Continue maintaining a healthy lifestyle.",
             "Stay hydrated and maintain a balanced diet.",
             "Regular monitoring helps track your health over time.",
-        ]
-    elif status in ["LOW", "CRITICAL_LOW"]:
-        return [
+        )
+    elif status in _LOW_STATUSES:
+        return (
             "Discuss this result with your doctor.",
             "Your doctor may recommend dietary changes or further evaluation.",
             "Follow your doctor's guidance for any necessary treatment.",
-        ]
-    elif status in ["HIGH", "CRITICAL_HIGH"]:
-        return [
+        )
+    elif status in _HIGH_STATUSES:
+        return (
             "Discuss this result with your doctor.",
             "Your doctor may recommend lifestyle modifications or further testing.",
             "Follow your doctor's guidance for any necessary treatment.",
-        ]
+        )
     else:
-        return ["Consult your doctor for interpretation of this result."]
+        return _DEFAULT_SUGGESTIONS
 
 
-def _generate_lipid_suggestions(test_type: TestType, status: str) -> List[str]:
+def _generate_lipid_suggestions(test_type: TestType, status: str) -> Tuple[str, ...]:
     """Generate general suggestions for Lipid Panel test results."""
-    if status in ["NORMAL"]:
-        return [
+    if status == "NORMAL":
+        return (
             "Continue maintaining heart-healthy habits.",
             "Regular exercise and a balanced diet support cardiovascular health.",
             "Regular monitoring helps track your heart health over time.",
-        ]
+        )
     elif status == "PROTECTIVE":
         # Special case for excellent HDL levels
-        return [
+        return (
             "Excellent! Your HDL level provides strong heart protection.",
             "Continue your current healthy lifestyle to maintain these levels.",
             "Regular exercise and a balanced diet support optimal HDL levels.",
-        ]
-    elif status in ["LOW", "CRITICAL_LOW"]:
+        )
+    elif status in _LOW_STATUSES:
         # For lipids, low is often good (except HDL)
         if test_type.key == "HDL":
-            return [
+            return (
                 "Discuss this result with your doctor.",
                 "Your doctor may recommend lifestyle changes to raise HDL levels.",
                 "Regular exercise can help improve HDL cholesterol.",
-            ]
+            )
         else:
-            return [
+            return (
                 "Low levels are generally favorable for heart health.",
                 "Continue maintaining healthy habits.",
-            ]
-    elif status in ["HIGH", "CRITICAL_HIGH"]:
-        return [
+            )
+    elif status in _HIGH_STATUSES:
+        return (
             "Discuss this result with your doctor.",
             "Your doctor may recommend dietary changes, exercise, or medication.",
             "Heart-healthy lifestyle changes can help improve lipid levels.",
             "Follow your doctor's guidance for managing cardiovascular risk.",
-        ]
+        )
     else:
-        return ["Consult your doctor for interpretation of this result."]
+        return _DEFAULT_SUGGESTIONS
+
+
+# Panel key -> (message table, message generator, suggestions generator)
+_PANEL_GUIDANCE = {
+    "CBC": (_CBC_MESSAGES, _generate_cbc_message, _generate_cbc_suggestions),
+    "METABOLIC": (_METABOLIC_MESSAGES, _generate_metabolic_message, _generate_metabolic_suggestions),
+    "LIPID": (_LIPID_MESSAGES, _generate_lipid_message, _generate_lipid_suggestions),
+}
@@ -12,6 +12,7 @@ References are based on standard Indian clinical practice and international guid
 adapted for Indian demographics.
 """
 
+from functools import lru_cache
 from typing import Optional, Tuple
 from dataclasses import dataclass
 
@@ -49,26 +50,46 @@ def get_personalized_range(
     if gender is None and age is None:
         return (default_low, default_high)
     
+    # Only the >60 years adjustment depends on age, so bucket it to a flag
+    personalized = _get_personalized_override(test_key, gender, bool(age and age > 60))
+    
+    # No override for this test/gender combination, so use the DB defaults
+    if personalized is None:
+        return (default_low, default_high)
+    
+    return personalized
+
+
+@lru_cache(maxsize=1024)
+def _get_personalized_override(
+    test_key: str,
+    gender: Optional[str],
+    is_elderly: bool
+) -> Optional[Tuple[float, float]]:
+    """
+    Get the demographic-specific range for a test, independent of DB defaults.
+    
+    Inputs form a small closed set (test keys x genders x age bucket), so
+    results are memoized.
+    
+    Returns:
+        Tuple of (ref_low, ref_high), or None when no personalization applies
+    """
     # Apply gender-specific ranges for CBC tests
     if test_key == "RBC":
-        return _get_rbc_range(gender, age, default_low, default_high)
+        return _get_rbc_range(gender, is_elderly)
     elif test_key == "HGB":
-        return _get_hgb_range(gender, age, default_low, default_high)
+        return _get_hgb_range(gender, is_elderly)
     elif test_key == "HCT":
-        return _get_hct_range(gender, age, default_low, default_high)
+        return _get_hct_range(gender, is_elderly)
     elif test_key == "HDL":
-        return _get_hdl_range(gender, age, default_low, default_high)
+        return _get_hdl_range(gender)
     
-    # For other tests, use defaults (can be extended in future)
-    return (default_low, default_high)
+    # No override for other tests (can be extended in future)
+    return None
 
 
-def _get_rbc_range(
-    gender: Optional[str],
-    age: Optional[int],
-    default_low: Optional[float],
-    default_high: Optional[float]
-) -> Tuple[Optional[float], Optional[float]]:
+def _get_rbc_range(gender: Optional[str], is_elderly: bool) -> Optional[Tuple[float, float]]:
     """
     Get RBC reference range based on gender and age.
     
@@ -82,23 +103,18 @@ def _get_rbc_range(
     elif gender == "F":
         low, high = 4.0, 5.2
     else:
-        # Use defaults if gender not specified
-        return (default_low, default_high)
+        # No override without a known gender; the caller keeps the DB defaults
+        return None
     
     # Age adjustment for elderly (>60 years)
-    if age and age > 60:
+    if is_elderly:
         low = max(low - 0.2, 3.5)  # Slight decrease, but not below 3.5
         high = high - 0.2
     
     return (low, high)
 
 
-def _get_hgb_range(
-    gender: Optional[str],
-    age: Optional[int],
-    default_low: Optional[float],
-    default_high: Optional[float]
-) -> Tuple[Optional[float], Optional[float]]:
+def _get_hgb_range(gender: Optional[str], is_elderly: bool) -> Optional[Tuple[float, float]]:
     """
     Get Hemoglobin reference range based on gender and age.
     
@@ -112,22 +128,18 @@ def _get_hgb_range(
     elif gender == "F":
         low, high = 12.0, 15.5
     else:
-        return (default_low, default_high)
+        # No override without a known gender; the caller keeps the DB defaults
+        return None
     
     # Age adjustment for elderly (>60 years)
-    if age and age > 60:
+    if is_elderly:
         low = max(low - 0.5, 11.0)  # Slight decrease
         high = high - 0.5
     
     return (low, high)
 
 
-def _get_hct_range(
-    gender: Optional[str],
-    age: Optional[int],
-    default_low: Optional[float],
-    default_high: Optional[float]
-) -> Tuple[Optional[float], Optional[float]]:
+def _get_hct_range(gender: Optional[str], is_elderly: bool) -> Optional[Tuple[float, float]]:
     """
     Get Hematocrit reference range based on gender and age.
     
@@ -141,24 +153,20 @@ def _get_hct_range(
     elif gender == "F":
         low, high = 36.0, 46.0
     else:
-        return (default_low, default_high)
+        # No override without a known gender; the caller keeps the DB defaults
+        return None
     
     # Age adjustment for elderly (>60 years)
-    if age and age > 60:
+    if is_elderly:
         low = max(low - 2.0, 33.0)
         high = high - 2.0
     
     return (low, high)
 
 
-def _get_hdl_range(
-    gender: Optional[str],
-    age: Optional[int],
-    default_low: Optional[float],
-    default_high: Optional[float]
-) -> Tuple[Optional[float], Optional[float]]:
+def _get_hdl_range(gender: Optional[str]) -> Optional[Tuple[float, float]]:
     """
-    Get HDL Cholesterol reference range based on gender and age.
+    Get HDL Cholesterol reference range based on gender.
     
     HDL ranges for Indian adults (mg/dL):
     - Males: 40 - 999 (protective if ≥60)
@@ -172,8 +180,8 @@ def _get_hdl_range(
     elif gender == "F":
         low = 50.0
     else:
-        # Use default if gender not specified
-        return (default_low, default_high)
+        # No override without a known gender; the caller keeps the DB defaults
+        return None
     
     # Upper limit remains very high (HDL is "good cholesterol")
     high = 999.0
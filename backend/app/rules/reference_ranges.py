@@ -8,11 +8,15 @@ for CBC, Metabolic Panel, and Lipid Panel tests.
 Now supports personalized reference ranges based on patient gender and age.
 """
 
-from typing import Optional
+from typing import List, NamedTuple, Optional, Sequence, Tuple
 from app.db.models import TestType
 from app.rules.personalized_ranges import get_personalized_range, get_hdl_status_modifier
 
 
+# Status labels indexed by the codes returned from _status_code()
+_STATUS_NAMES = ("CRITICAL_LOW", "LOW", "NORMAL", "HIGH", "CRITICAL_HIGH")
+
+
 def compute_status(
     test_type: TestType,
     value: float,
@@ -50,63 +54,160 @@ def compute_status(
         default_high=test_type.ref_high
     )
     
-    # When a TestType has no defined reference ranges, assign UNKNOWN
+    return _status_for_thresholds(
+        test_type.key, _thresholds(ref_low, ref_high), value, patient_gender
+    )
+
+
+def compute_status_batch(
+    test_types: Sequence[TestType],
+    values: Sequence[float],
+    patient_gender: Optional[str] = None,
+    patient_age: Optional[int] = None
+) -> List[str]:
+    """
+    Compute statuses for all results of a single report in one pass.
+    
+    Every row of a report shares the same patient demographics, so the
+    personalized reference range and its critical thresholds are resolved
+    once per test type and reused for all of its values instead of once
+    per row.
+    
+    Args:
+        test_types: TestType objects, one per result
+        values: Test result values, aligned with test_types
+        patient_gender: Patient gender ('M' or 'F') for personalized ranges
+        patient_age: Patient age in years for personalized ranges
+    
+    Returns:
+        List of status strings aligned with the input rows, identical to
+        calling compute_status() for each row
+    """
+    thresholds_by_key = {}
+    statuses = []
+    
+    for test_type, value in zip(test_types, values):
+        test_key = test_type.key
+        if test_key in thresholds_by_key:
+            thresholds = thresholds_by_key[test_key]
+        else:
+            ref_low, ref_high = get_personalized_range(
+                test_key=test_key,
+                gender=patient_gender,
+                age=patient_age,
+                default_low=test_type.ref_low,
+                default_high=test_type.ref_high
+            )
+            thresholds = thresholds_by_key[test_key] = _thresholds(ref_low, ref_high)
+        statuses.append(
+            _status_for_thresholds(test_key, thresholds, value, patient_gender)
+        )
+    
+    return statuses
+
+
+def _thresholds(
+    ref_low: Optional[float],
+    ref_high: Optional[float]
+) -> Optional[Tuple[float, float, float, float]]:
+    """
+    Resolve a personalized reference range into its four status thresholds.
+    
+    Returns:
+        (critical_low, ref_low, ref_high, critical_high), or None when the
+        range is not defined
+    """
     if ref_low is None or ref_high is None:
+        return None
+    
+    # Critical thresholds (50% beyond normal range)
+    return (ref_low * 0.5, ref_low, ref_high, ref_high * 1.5)
+
+
+def _status_for_thresholds(
+    test_key: str,
+    thresholds: Optional[Tuple[float, float, float, float]],
+    value: float,
+    patient_gender: Optional[str]
+) -> str:
+    """Classify a value against already-resolved status thresholds."""
+    # When a TestType has no defined reference ranges, assign UNKNOWN
+    if thresholds is None:
         return "UNKNOWN"
     
     # Special handling for HDL - check for protective status first
-    if test_type.key == "HDL":
+    if test_key == "HDL":
         hdl_modifier = get_hdl_status_modifier(value, patient_gender)
         if hdl_modifier == "PROTECTIVE":
             return "PROTECTIVE"  # HDL >= 60 is excellent
     
-    # Critical thresholds (50% beyond normal range)
-    critical_low = ref_low * 0.5
-    critical_high = ref_high * 1.5
+    return _STATUS_NAMES[_status_code(*thresholds, value)]
+
+
+def _status_code(
+    critical_low: float,
+    ref_low: float,
+    ref_high: float,
+    critical_high: float,
+    value: float
+) -> int:
+    """
+    Classify a value into a status code (index into _STATUS_NAMES).
     
+    Takes plain, precomputed floats only so it can run in a tight loop
+    without any attribute access or arithmetic.
+    """
     # When a test value is below the reference low threshold, assign LOW
     # Also handle CRITICAL_LOW for values significantly below threshold
     if value < critical_low:
-        return "CRITICAL_LOW"
+        return 0  # CRITICAL_LOW
     elif value < ref_low:
-        return "LOW"
+        return 1  # LOW
     # When a test value is between ref_low and ref_high (inclusive), assign NORMAL
     elif value <= ref_high:
-        return "NORMAL"
+        return 2  # NORMAL
     # When a test value is above the reference high threshold, assign HIGH
     # Also handle CRITICAL_HIGH for values significantly above threshold
     elif value <= critical_high:
-        return "HIGH"
+        return 3  # HIGH
     else:
-        return "CRITICAL_HIGH"
+        return 4  # CRITICAL_HIGH
 
 
 # Seed data for reference ranges
 # These constants are used to populate the database with TestType records
 
+
+class DefaultRange(NamedTuple):
+    """Default reference range and unit for a single test type."""
+    low: float
+    high: float
+    unit: str
+
+
 CBC_REFERENCE_RANGES = {
-    "WBC": {"low": 4.5, "high": 11.0, "unit": "10^3/µL"},
-    "RBC": {"low": 4.5, "high": 5.9, "unit": "10^6/µL"},
-    "HGB": {"low": 13.5, "high": 17.5, "unit": "g/dL"},
-    "HCT": {"low": 38.8, "high": 50.0, "unit": "%"},
-    "PLT": {"low": 150, "high": 400, "unit": "10^3/µL"},
-    "MCV": {"low": 80, "high": 100, "unit": "fL"},
+    "WBC": DefaultRange(4.5, 11.0, "10^3/µL"),
+    "RBC": DefaultRange(4.5, 5.9, "10^6/µL"),
+    "HGB": DefaultRange(13.5, 17.5, "g/dL"),
+    "HCT": DefaultRange(38.8, 50.0, "%"),
+    "PLT": DefaultRange(150, 400, "10^3/µL"),
+    "MCV": DefaultRange(80, 100, "fL"),
 }
 
 METABOLIC_REFERENCE_RANGES = {
-    "GLUCOSE": {"low": 70, "high": 100, "unit": "mg/dL"},
-    "BUN": {"low": 7, "high": 20, "unit": "mg/dL"},
-    "CREATININE": {"low": 0.7, "high": 1.3, "unit": "mg/dL"},
-    "SODIUM": {"low": 136, "high": 145, "unit": "mmol/L"},
-    "POTASSIUM": {"low": 3.5, "high": 5.0, "unit": "mmol/L"},
-    "CHLORIDE": {"low": 98, "high": 107, "unit": "mmol/L"},
-    "CO2": {"low": 23, "high": 29, "unit": "mmol/L"},
-    "CALCIUM": {"low": 8.5, "high": 10.5, "unit": "mg/dL"},
+    "GLUCOSE": DefaultRange(70, 100, "mg/dL"),
+    "BUN": DefaultRange(7, 20, "mg/dL"),
+    "CREATININE": DefaultRange(0.7, 1.3, "mg/dL"),
+    "SODIUM": DefaultRange(136, 145, "mmol/L"),
+    "POTASSIUM": DefaultRange(3.5, 5.0, "mmol/L"),
+    "CHLORIDE": DefaultRange(98, 107, "mmol/L"),
+    "CO2": DefaultRange(23, 29, "mmol/L"),
+    "CALCIUM": DefaultRange(8.5, 10.5, "mg/dL"),
 }
 
 LIPID_REFERENCE_RANGES = {
-    "TC": {"low": 0, "high": 200, "unit": "mg/dL"},
-    "LDL": {"low": 0, "high": 100, "unit": "mg/dL"},
-    "HDL": {"low": 40, "high": 999, "unit": "mg/dL"},
-    "TRIG": {"low": 0, "high": 150, "unit": "mg/dL"},
+    "TC": DefaultRange(0, 200, "mg/dL"),
+    "LDL": DefaultRange(0, 100, "mg/dL"),
+    "HDL": DefaultRange(40, 999, "mg/dL"),
+    "TRIG": DefaultRange(0, 150, "mg/dL"),
 }
@@ -1,4 +1,10 @@
-from pydantic import BaseModel, EmailStr, Field
+from functools import lru_cache
+
+from pydantic import BaseModel, EmailStr, Field, TypeAdapter, ValidationError
+
+
+# Built once so email validation does not rebuild a validator per call
+_EMAIL_ADAPTER = TypeAdapter(EmailStr)
 
 
 class UserRegister(BaseModel):
@@ -22,3 +28,20 @@ class Token(BaseModel):
 class TokenData(BaseModel):
     """Schema for decoded token data"""
     user_id: int | None = None
+
+
+@lru_cache(maxsize=10000)
+def validate_login_email(email: str) -> str | None:
+    """
+    Validate and normalize a login email, caching the result.
+    
+    Repeat logins for the same address skip email-validator entirely.
+    
+    Returns:
+        The normalized email (as stored at registration), or None if the
+        value is not a valid email address
+    """
+    try:
+        return _EMAIL_ADAPTER.validate_python(email)
+    except ValidationError:
+        return None
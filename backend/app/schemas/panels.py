@@ -1,4 +1,4 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 
 
 class PanelBase(BaseModel):
@@ -11,8 +11,7 @@ class PanelResponse(PanelBase):
     """Response schema for Panel"""
     id: int
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class TestTypeBase(BaseModel):
@@ -29,5 +28,4 @@ class TestTypeResponse(TestTypeBase):
     id: int
     panel_id: int
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
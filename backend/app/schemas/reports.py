@@ -1,4 +1,4 @@
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, ConfigDict
 from datetime import datetime
 
 
@@ -29,8 +29,7 @@ class ReportResponse(ReportBase):
     parsed_success: bool
     notes: str | None = None
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class ReportSummary(BaseModel):
@@ -41,5 +40,4 @@ class ReportSummary(BaseModel):
     parsed_success: bool
     test_count: int = Field(description="Number of test results extracted")
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
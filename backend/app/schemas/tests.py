@@ -1,4 +1,5 @@
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, ConfigDict, TypeAdapter
+from typing_extensions import TypedDict
 from datetime import datetime
 
 
@@ -27,8 +28,7 @@ class TestResultResponse(TestResultBase):
     confidence: float | None = None
     created_at: datetime
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class TestHistoryDataPoint(BaseModel):
@@ -38,8 +38,7 @@ class TestHistoryDataPoint(BaseModel):
     unit: str = Field(description="Unit of measurement")
     status: str = Field(description="Status: LOW, NORMAL, HIGH, etc.")
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class TestHistoryMetadata(BaseModel):
@@ -57,8 +56,31 @@ class TestHistoryResponse(BaseModel):
     metadata: TestHistoryMetadata
     data: list[TestHistoryDataPoint] = Field(description="Historical test results")
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
+
+
+class TestHistoryDataPointRow(TypedDict):
+    """
+    Serialization-only shape of TestHistoryDataPoint.
+    
+    History rows come straight from the database, so they are encoded as
+    plain dicts without building (and validating) a model per data point.
+    TestHistoryResponse remains the documented response schema.
+    """
+    timestamp: datetime
+    value: float
+    unit: str
+    status: str
+
+
+class TestHistoryPayload(TypedDict):
+    """Serialization-only shape of TestHistoryResponse"""
+    metadata: TestHistoryMetadata
+    data: list[TestHistoryDataPointRow]
+
+
+# Encodes a whole history response in a single pydantic-core call
+HISTORY_PAYLOAD_ADAPTER = TypeAdapter(TestHistoryPayload)
 
 
 class LatestTestResult(BaseModel):
@@ -68,8 +90,7 @@ class LatestTestResult(BaseModel):
     unit: str
     status: str
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class GuidanceData(BaseModel):
@@ -88,5 +109,4 @@ class LatestInsightResponse(BaseModel):
     )
     guidance: GuidanceData = Field(description="Educational guidance and insights")
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
@@ -73,6 +73,36 @@ engine = create_engine(
 )
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+# CBC test types: (key, display_name, unit, ref_low, ref_high)
+CBC_TESTS = (
+    ("WBC", "White Blood Cells", "10^3/µL", 4.5, 11.0),
+    ("RBC", "Red Blood Cells", "10^6/µL", 4.5, 5.9),
+    ("HGB", "Hemoglobin", "g/dL", 13.5, 17.5),
+    ("HCT", "Hematocrit", "%", 38.8, 50.0),
+    ("PLT", "Platelets", "10^3/µL", 150.0, 400.0),
+    ("MCV", "Mean Corpuscular Volume", "fL", 80.0, 100.0),
+)
+
+# Metabolic Panel test types: (key, display_name, unit, ref_low, ref_high)
+METABOLIC_TESTS = (
+    ("GLUCOSE", "Glucose", "mg/dL", 70.0, 100.0),
+    ("BUN", "Blood Urea Nitrogen", "mg/dL", 7.0, 20.0),
+    ("CREATININE", "Creatinine", "mg/dL", 0.7, 1.3),
+    ("SODIUM", "Sodium", "mmol/L", 136.0, 145.0),
+    ("POTASSIUM", "Potassium", "mmol/L", 3.5, 5.0),
+    ("CHLORIDE", "Chloride", "mmol/L", 98.0, 107.0),
+    ("CO2", "Carbon Dioxide", "mmol/L", 23.0, 29.0),
+    ("CALCIUM", "Calcium", "mg/dL", 8.5, 10.5),
+)
+
+# Lipid Panel test types: (key, display_name, unit, ref_low, ref_high)
+LIPID_TESTS = (
+    ("TC", "Total Cholesterol", "mg/dL", 0.0, 200.0),
+    ("LDL", "LDL Cholesterol", "mg/dL", 0.0, 100.0),
+    ("HDL", "HDL Cholesterol", "mg/dL", 40.0, 999.0),
+    ("TRIG", "Triglycerides", "mg/dL", 0.0, 150.0),
+)
+
 
 def seed_panels(db: Session):
     """Create the three supported lab panels"""
@@ -100,196 +130,56 @@ def seed_panels(db: Session):
     return panels
 
 
-def seed_cbc_tests(db: Session, panel: Panel):
-    """Create CBC test types with reference ranges"""
-    cbc_tests = [
-        {
-            "key": "WBC",
-            "display_name": "White Blood Cells",
-            "unit": "10^3/µL",
-            "ref_low": 4.5,
-            "ref_high": 11.0,
-        },
-        {
-            "key": "RBC",
-            "display_name": "Red Blood Cells",
-            "unit": "10^6/µL",
-            "ref_low": 4.5,
-            "ref_high": 5.9,
-        },
-        {
-            "key": "HGB",
-            "display_name": "Hemoglobin",
-            "unit": "g/dL",
-            "ref_low": 13.5,
-            "ref_high": 17.5,
-        },
-        {
-            "key": "HCT",
-            "display_name": "Hematocrit",
-            "unit": "%",
-            "ref_low": 38.8,
-            "ref_high": 50.0,
-        },
-        {
-            "key": "PLT",
-            "display_name": "Platelets",
-            "unit": "10^3/µL",
-            "ref_low": 150.0,
-            "ref_high": 400.0,
-        },
-        {
-            "key": "MCV",
-            "display_name": "Mean Corpuscular Volume",
-            "unit": "fL",
-            "ref_low": 80.0,
-            "ref_high": 100.0,
-        },
-    ]
+def _seed_test_types(db: Session, panel: Panel, tests: tuple):
+    """
+    Create the given test types for a panel, skipping ones that already exist.
+    
+    Existing keys are looked up with a single query and all missing rows are
+    inserted in one flush, instead of one query and one flush per test.
+    """
+    keys = [key for key, _, _, _, _ in tests]
+    existing = {
+        test_type.key: test_type
+        for test_type in db.query(TestType).filter(TestType.key.in_(keys))
+    }
     
     test_types = {}
-    for test_data in cbc_tests:
-        existing = db.query(TestType).filter(TestType.key == test_data["key"]).first()
-        if existing:
-            test_types[test_data["key"]] = existing
-            print(f"  Test {test_data['key']} already exists, skipping...")
+    new_test_types = []
+    for key, display_name, unit, ref_low, ref_high in tests:
+        if key in existing:
+            test_types[key] = existing[key]
+            print(f"  Test {key} already exists, skipping...")
         else:
-            test_type = TestType(panel_id=panel.id, **test_data)
-            db.add(test_type)
-            db.flush()
-            test_types[test_data["key"]] = test_type
-            print(f"  Created test: {test_data['display_name']}")
+            test_type = TestType(
+                panel_id=panel.id,
+                key=key,
+                display_name=display_name,
+                unit=unit,
+                ref_low=ref_low,
+                ref_high=ref_high
+            )
+            new_test_types.append(test_type)
+            test_types[key] = test_type
+            print(f"  Created test: {display_name}")
     
+    db.add_all(new_test_types)
     db.commit()
     return test_types
 
 
+def seed_cbc_tests(db: Session, panel: Panel):
+    """Create CBC test types with reference ranges"""
+    return _seed_test_types(db, panel, CBC_TESTS)
+
+
 def seed_metabolic_tests(db: Session, panel: Panel):
     """Create Metabolic Panel test types with reference ranges"""
-    metabolic_tests = [
-        {
-            "key": "GLUCOSE",
-            "display_name": "Glucose",
-            "unit": "mg/dL",
-            "ref_low": 70.0,
-            "ref_high": 100.0,
-        },
-        {
-            "key": "BUN",
-            "display_name": "Blood Urea Nitrogen",
-            "unit": "mg/dL",
-            "ref_low": 7.0,
-            "ref_high": 20.0,
-        },
-        {
-            "key": "CREATININE",
-            "display_name": "Creatinine",
-            "unit": "mg/dL",
-            "ref_low": 0.7,
-            "ref_high": 1.3,
-        },
-        {
-            "key": "SODIUM",
-            "display_name": "Sodium",
-            "unit": "mmol/L",
-            "ref_low": 136.0,
-            "ref_high": 145.0,
-        },
-        {
-            "key": "POTASSIUM",
-            "display_name": "Potassium",
-            "unit": "mmol/L",
-            "ref_low": 3.5,
-            "ref_high": 5.0,
-        },
-        {
-            "key": "CHLORIDE",
-            "display_name": "Chloride",
-            "unit": "mmol/L",
-            "ref_low": 98.0,
-            "ref_high": 107.0,
-        },
-        {
-            "key": "CO2",
-            "display_name": "Carbon Dioxide",
-            "unit": "mmol/L",
-            "ref_low": 23.0,
-            "ref_high": 29.0,
-        },
-        {
-            "key": "CALCIUM",
-            "display_name": "Calcium",
-            "unit": "mg/dL",
-            "ref_low": 8.5,
-            "ref_high": 10.5,
-        },
-    ]
-    
-    test_types = {}
-    for test_data in metabolic_tests:
-        existing = db.query(TestType).filter(TestType.key == test_data["key"]).first()
-        if existing:
-            test_types[test_data["key"]] = existing
-            print(f"  Test {test_data['key']} already exists, skipping...")
-        else:
-            test_type = TestType(panel_id=panel.id, **test_data)
-            db.add(test_type)
-            db.flush()
-            test_types[test_data["key"]] = test_type
-            print(f"  Created test: {test_data['display_name']}")
-    
-    db.commit()
-    return test_types
+    return _seed_test_types(db, panel, METABOLIC_TESTS)
 
 
 def seed_lipid_tests(db: Session, panel: Panel):
     """Create Lipid Panel test types with reference ranges"""
-    lipid_tests = [
-        {
-            "key": "TC",
-            "display_name": "Total Cholesterol",
-            "unit": "mg/dL",
-            "ref_low": 0.0,
-            "ref_high": 200.0,
-        },
-        {
-            "key": "LDL",
-            "display_name": "LDL Cholesterol",
-            "unit": "mg/dL",
-            "ref_low": 0.0,
-            "ref_high": 100.0,
-        },
-        {
-            "key": "HDL",
-            "display_name": "HDL Cholesterol",
-            "unit": "mg/dL",
-            "ref_low": 40.0,
-            "ref_high": 999.0,
-        },
-        {
-            "key": "TRIG",
-            "display_name": "Triglycerides",
-            "unit": "mg/dL",
-            "ref_low": 0.0,
-            "ref_high": 150.0,
-        },
-    ]
-    
-    test_types = {}
-    for test_data in lipid_tests:
-        existing = db.query(TestType).filter(TestType.key == test_data["key"]).first()
-        if existing:
-            test_types[test_data["key"]] = existing
-            print(f"  Test {test_data['key']} already exists, skipping...")
-        else:
-            test_type = TestType(panel_id=panel.id, **test_data)
-            db.add(test_type)
-            db.flush()
-            test_types[test_data["key"]] = test_type
-            print(f"  Created test: {test_data['display_name']}")
-    
-    db.commit()
-    return test_types
+    return _seed_test_types(db, panel, LIPID_TESTS)
 
 
 def seed_test_aliases(db: Session, test_types: dict):
@@ -320,25 +210,27 @@ def seed_test_aliases(db: Session, test_types: dict):
         ("TRIG", ["trig", "triglycerides", "triglyceride", "trigs", "tg"]),
     ]
     
-    alias_count = 0
+    # Fetch every existing alias once instead of querying per alias
+    existing_aliases = {alias for (alias,) in db.query(TestAlias.alias)}
+    
+    new_aliases = []
     for test_key, aliases in aliases_data:
         if test_key not in test_types:
             print(f"  Warning: Test type {test_key} not found, skipping aliases")
             continue
         
-        test_type = test_types[test_key]
+        test_type_id = test_types[test_key].id
         for alias_text in aliases:
-            # Check if alias already exists
-            existing = db.query(TestAlias).filter(TestAlias.alias == alias_text.lower()).first()
-            if existing:
+            alias_text = alias_text.lower()
+            if alias_text in existing_aliases:
                 continue
             
-            alias = TestAlias(
-                alias=alias_text.lower(),
-                test_type_id=test_type.id
-            )
-            db.add(alias)
-            alias_count += 1
+            existing_aliases.add(alias_text)
+            new_aliases.append({"alias": alias_text, "test_type_id": test_type_id})
+    
+    alias_count = len(new_aliases)
+    if new_aliases:
+        db.bulk_insert_mappings(TestAlias, new_aliases)
     
     db.commit()
     print(f"Created {alias_count} test aliases")
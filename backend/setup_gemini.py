@@ -5,9 +5,15 @@ This script helps you set up your .env file with the Gemini API key.
 """
 
 import os
+import re
+import shutil
 from pathlib import Path
 
 
+# Matches GEMINI_API_KEY assignments in .env, capturing the value
+_GEMINI_KEY_RE = re.compile(rb"(?m)^[ \t]*GEMINI_API_KEY=([^\r\n]*)")
+
+
 def setup_gemini_api():
     """Interactive setup for Gemini API key."""
     
@@ -23,28 +29,19 @@ def setup_gemini_api():
     if not env_path.exists():
         print("📋 No .env file found. Creating from .env.example...")
         if env_example_path.exists():
-            with open(env_example_path, 'r') as f:
-                content = f.read()
-            with open(env_path, 'w') as f:
-                f.write(content)
+            shutil.copyfile(env_example_path, env_path)
             print("✅ Created .env file")
         else:
             print("❌ .env.example not found!")
             return
     
-    # Read current .env
-    with open(env_path, 'r') as f:
-        lines = f.readlines()
+    # Read current .env in a single unbuffered read
+    content = env_path.read_bytes()
     
     # Check if GEMINI_API_KEY is already set
-    has_gemini_key = False
-    gemini_key_value = ""
-    
-    for line in lines:
-        if line.strip().startswith("GEMINI_API_KEY="):
-            has_gemini_key = True
-            gemini_key_value = line.split("=", 1)[1].strip()
-            break
+    match = _GEMINI_KEY_RE.search(content)
+    has_gemini_key = match is not None
+    gemini_key_value = match.group(1).decode().strip() if match else ""
     
     if has_gemini_key and gemini_key_value and gemini_key_value != "your-gemini-api-key-here":
         print(f"✅ Gemini API key is already configured")
@@ -69,25 +66,18 @@ def setup_gemini_api():
         print("❌ No API key provided. Setup cancelled.")
         return
     
-    # Update .env file
-    updated_lines = []
-    key_updated = False
-    
-    for line in lines:
-        if line.strip().startswith("GEMINI_API_KEY="):
-            updated_lines.append(f"GEMINI_API_KEY={api_key}\n")
-            key_updated = True
-        else:
-            updated_lines.append(line)
+    # Update .env file, replacing every existing assignment in one pass
+    new_line = f"GEMINI_API_KEY={api_key}".encode()
+    content, key_updated = _GEMINI_KEY_RE.subn(lambda _: new_line, content)
     
     # If key wasn't in file, add it
     if not key_updated:
-        updated_lines.append(f"\n# Gemini API Configuration\n")
-        updated_lines.append(f"GEMINI_API_KEY={api_key}\n")
+        content += b"\n# Gemini API Configuration\n" + new_line + b"\n"
     
-    # Write back to .env
-    with open(env_path, 'w') as f:
-        f.writelines(updated_lines)
+    # Write back to .env atomically so an interrupted write cannot truncate it
+    tmp_path = env_path.with_name(".env.tmp")
+    tmp_path.write_bytes(content)
+    os.replace(tmp_path, env_path)
     
     print()
     print("✅ Gemini API key configured successfully!")
@@ -6,26 +6,36 @@ for lab test results, including trend computation and panel-specific messages.
 """
 
 import pytest
-from app.rules.guidance_engine import generate_guidance, _compute_trend, _is_improving
+from dataclasses import InitVar, dataclass, field
+from typing import Optional
+from app.rules.guidance_engine import generate_guidance, generate_guidance_bulk, _compute_trend, _is_improving
 from app.db.models import TestType, Panel
 
 
+@dataclass(slots=True)
 class MockPanel:
     """Mock Panel object for testing."""
-    def __init__(self, key: str, display_name: str):
-        self.key = key
-        self.display_name = display_name
+    key: str
+    display_name: str
 
 
+@dataclass(slots=True)
 class MockTestType:
     """Mock TestType object for testing."""
-    def __init__(self, key: str, display_name: str, panel_key: str, ref_low: float = None, ref_high: float = None, unit: str = "mg/dL"):
-        self.key = key
-        self.display_name = display_name
+    key: str
+    display_name: str
+    panel_key: InitVar[str]
+    ref_low: Optional[float] = None
+    ref_high: Optional[float] = None
+    unit: str = "mg/dL"
+    panel: MockPanel = field(init=False)
+
+    def __post_init__(self, panel_key: str):
         self.panel = MockPanel(panel_key, f"{panel_key} Panel")
-        self.ref_low = ref_low
-        self.ref_high = ref_high
-        self.unit = unit
+
+
+# Shared WBC test type for tests that only read it
+WBC_CBC = MockTestType("WBC", "White Blood Cells", "CBC", 4.5, 11.0)
 
 
 class TestGenerateGuidance:
@@ -33,17 +43,13 @@ class TestGenerateGuidance:
     
     def test_guidance_includes_all_required_fields(self):
         """Test that guidance includes message, trend, suggestions, and disclaimer."""
-        test_type = MockTestType("WBC", "White Blood Cells", "CBC", 4.5, 11.0)
+        test_type = WBC_CBC
         
         result = generate_guidance(test_type, 7.0, "NORMAL")
         
-        assert "message" in result
-        assert "trend" in result
-        assert "suggestions" in result
-        assert "disclaimer" in result
-        assert isinstance(result["message"], str)
-        assert isinstance(result["suggestions"], list)
-        assert isinstance(result["disclaimer"], str)
+        assert isinstance(result.message, str)
+        assert isinstance(result.suggestions, tuple)
+        assert isinstance(result.disclaimer, str)
     
     def test_guidance_always_includes_disclaimer(self):
         """Test that disclaimer is always present (Requirement 12.5, 13.4, 13.5)."""
@@ -51,19 +57,18 @@ class TestGenerateGuidance:
         
         result = generate_guidance(test_type, 85, "NORMAL")
         
-        assert "disclaimer" in result
-        assert len(result["disclaimer"]) > 0
-        assert "NOT a medical diagnosis" in result["disclaimer"]
-        assert "consult" in result["disclaimer"].lower()
+        assert len(result.disclaimer) > 0
+        assert "NOT a medical diagnosis" in result.disclaimer
+        assert "consult" in result.disclaimer.lower()
     
     def test_cbc_guidance_mentions_blood_cells(self):
         """Test that CBC guidance mentions blood cell levels (Requirement 13.1)."""
-        test_type = MockTestType("WBC", "White Blood Cells", "CBC", 4.5, 11.0)
+        test_type = WBC_CBC
         
         result = generate_guidance(test_type, 7.0, "NORMAL")
         
         # Should mention blood cells or related terms
-        message_lower = result["message"].lower()
+        message_lower = result.message.lower()
         assert any(term in message_lower for term in ["blood", "cell", "wbc", "white blood"])
     
     def test_metabolic_guidance_mentions_organ_function(self):
@@ -73,7 +78,7 @@ class TestGenerateGuidance:
         result = generate_guidance(test_type, 1.0, "NORMAL")
         
         # Should mention kidney or organ function
-        message_lower = result["message"].lower()
+        message_lower = result.message.lower()
         assert any(term in message_lower for term in ["kidney", "organ", "function", "filter"])
     
     def test_lipid_guidance_mentions_heart_health(self):
@@ -83,25 +88,67 @@ class TestGenerateGuidance:
         result = generate_guidance(test_type, 80, "NORMAL")
         
         # Should mention heart, cardiovascular, or cholesterol
-        message_lower = result["message"].lower()
+        message_lower = result.message.lower()
         assert any(term in message_lower for term in ["heart", "cardiovascular", "cholesterol", "arteries"])
     
     def test_trend_is_none_without_previous_value(self):
         """Test that trend is None when no previous value provided."""
-        test_type = MockTestType("WBC", "White Blood Cells", "CBC", 4.5, 11.0)
+        test_type = WBC_CBC
         
         result = generate_guidance(test_type, 7.0, "NORMAL", previous_value=None)
         
-        assert result["trend"] is None
+        assert result.trend is None
     
     def test_trend_computed_with_previous_value(self):
         """Test that trend is computed when previous value provided (Requirement 12.4)."""
-        test_type = MockTestType("WBC", "White Blood Cells", "CBC", 4.5, 11.0)
+        test_type = WBC_CBC
         
         result = generate_guidance(test_type, 7.0, "NORMAL", previous_value=6.0)
         
-        assert result["trend"] is not None
-        assert result["trend"] in ["improving", "worsening", "stable"]
+        assert result.trend is not None
+        assert result.trend in ["improving", "worsening", "stable"]
+
+    def test_unknown_panel_guidance_without_previous_value(self):
+        """Test that tests outside supported panels get generic guidance."""
+        test_type = MockTestType("TSH", "Thyroid Stimulating Hormone", "THYROID", 0.4, 4.0)
+
+        result = generate_guidance(test_type, 2.0, "NORMAL")
+
+        assert result.message == "This test measures Thyroid Stimulating Hormone."
+        assert result.trend is None
+        assert len(result.suggestions) == 1
+        assert "NOT a medical diagnosis" in result.disclaimer
+
+    def test_guidance_to_dict_for_api_responses(self):
+        """Test that to_dict() returns the API response shape."""
+        test_type = WBC_CBC
+
+        result = generate_guidance(test_type, 7.0, "NORMAL", previous_value=6.0).to_dict()
+
+        assert set(result) == {"message", "trend", "suggestions", "disclaimer"}
+        assert isinstance(result["suggestions"], list)
+
+
+class TestGenerateGuidanceBulk:
+    """Test suite for generate_guidance_bulk function."""
+    
+    def test_bulk_matches_single_row_guidance(self):
+        """Test that bulk guidance matches per-row guidance and keeps input order."""
+        rows = [
+            (WBC_CBC, 12.0, "HIGH", 10.0),
+            (MockTestType("LDL", "LDL Cholesterol", "LIPID", 0, 100), 80, "NORMAL", None),
+            (MockTestType("TSH", "Thyroid Stimulating Hormone", "THYROID", 0.4, 4.0), 2.0, "NORMAL", 2.1),
+            (MockTestType("GLUCOSE", "Glucose", "METABOLIC", 70, 100), 60, "LOW", 80),
+            (MockTestType("XYZ", "Unlisted Test", "CBC", 1.0, 2.0), 1.5, "NORMAL", None),
+        ]
+        
+        results = generate_guidance_bulk(rows)
+        
+        assert results == [generate_guidance(*row) for row in rows]
+    
+    def test_bulk_with_no_rows(self):
+        """Test that an empty input returns an empty list."""
+        assert generate_guidance_bulk([]) == []
 
 
 class TestComputeTrend:
@@ -109,7 +156,7 @@ class TestComputeTrend:
     
     def test_trend_is_none_without_previous_value(self):
         """Test that trend returns None when no previous value."""
-        test_type = MockTestType("WBC", "White Blood Cells", "CBC", 4.5, 11.0)
+        test_type = WBC_CBC
         
         trend = _compute_trend(test_type, 7.0, "NORMAL", None)
         
@@ -117,7 +164,7 @@ class TestComputeTrend:
     
     def test_trend_stable_for_small_changes(self):
         """Test that small changes result in 'stable' trend."""
-        test_type = MockTestType("WBC", "White Blood Cells", "CBC", 4.5, 11.0)
+        test_type = WBC_CBC
         # Range is 6.5, 5% is 0.325
         
         trend = _compute_trend(test_type, 7.0, "NORMAL", 7.1)
@@ -126,7 +173,7 @@ class TestComputeTrend:
     
     def test_trend_improving_when_moving_toward_normal(self):
         """Test that moving toward normal range is 'improving'."""
-        test_type = MockTestType("WBC", "White Blood Cells", "CBC", 4.5, 11.0)
+        test_type = WBC_CBC
         # Normal midpoint is 7.75
         
         # Moving from 12.0 (high) to 10.0 (closer to normal)
@@ -136,7 +183,7 @@ class TestComputeTrend:
     
     def test_trend_worsening_when_moving_away_from_normal(self):
         """Test that moving away from normal range is 'worsening'."""
-        test_type = MockTestType("WBC", "White Blood Cells", "CBC", 4.5, 11.0)
+        test_type = WBC_CBC
         # Normal midpoint is 7.75
         
         # Moving from 10.0 to 12.0 (further from normal)
@@ -159,7 +206,7 @@ class TestIsImproving:
     
     def test_improving_when_closer_to_midpoint(self):
         """Test that values closer to normal midpoint are improving."""
-        test_type = MockTestType("WBC", "White Blood Cells", "CBC", 4.5, 11.0)
+        test_type = WBC_CBC
         # Midpoint is 7.75
         
         # Current 8.0 is closer to 7.75 than previous 10.0
@@ -169,7 +216,7 @@ class TestIsImproving:
     
     def test_not_improving_when_further_from_midpoint(self):
         """Test that values further from normal midpoint are not improving."""
-        test_type = MockTestType("WBC", "White Blood Cells", "CBC", 4.5, 11.0)
+        test_type = WBC_CBC
         # Midpoint is 7.75
         
         # Current 10.0 is further from 7.75 than previous 8.0
@@ -179,7 +226,7 @@ class TestIsImproving:
     
     def test_improving_from_low_to_normal(self):
         """Test that moving from low to normal is improving."""
-        test_type = MockTestType("WBC", "White Blood Cells", "CBC", 4.5, 11.0)
+        test_type = WBC_CBC
         # Midpoint is 7.75
         
         # Moving from 3.0 (low) to 5.0 (closer to normal)
@@ -191,55 +238,81 @@ class TestIsImproving:
 class TestPanelSpecificMessages:
     """Test that each panel generates appropriate messages."""
     
-    def test_all_cbc_tests_generate_messages(self):
-        """Test that all CBC tests generate appropriate messages."""
-        cbc_tests = ["WBC", "RBC", "HGB", "HCT", "PLT", "MCV"]
-        
-        for test_key in cbc_tests:
-            test_type = MockTestType(test_key, f"Test {test_key}", "CBC", 1.0, 10.0)
-            result = generate_guidance(test_type, 5.0, "NORMAL")
-            
-            assert len(result["message"]) > 0
-            assert len(result["suggestions"]) > 0
+    @pytest.mark.parametrize("test_key", ["WBC", "RBC", "HGB", "HCT", "PLT", "MCV"])
+    def test_cbc_test_generates_message(self, test_key):
+        """Test that each CBC test generates appropriate messages."""
+        test_type = MockTestType(test_key, f"Test {test_key}", "CBC", 1.0, 10.0)
+        result = generate_guidance(test_type, 5.0, "NORMAL")
+        
+        assert len(result.message) > 0
+        assert len(result.suggestions) > 0
     
-    def test_all_metabolic_tests_generate_messages(self):
-        """Test that all Metabolic tests generate appropriate messages."""
-        metabolic_tests = ["GLUCOSE", "BUN", "CREATININE", "SODIUM", "POTASSIUM", "CHLORIDE", "CO2", "CALCIUM"]
-        
-        for test_key in metabolic_tests:
-            test_type = MockTestType(test_key, f"Test {test_key}", "METABOLIC", 1.0, 10.0)
-            result = generate_guidance(test_type, 5.0, "NORMAL")
-            
-            assert len(result["message"]) > 0
-            assert len(result["suggestions"]) > 0
+    @pytest.mark.parametrize("test_key", ["GLUCOSE", "BUN", "CREATININE", "SODIUM", "POTASSIUM", "CHLORIDE", "CO2", "CALCIUM"])
+    def test_metabolic_test_generates_message(self, test_key):
+        """Test that each Metabolic test generates appropriate messages."""
+        test_type = MockTestType(test_key, f"Test {test_key}", "METABOLIC", 1.0, 10.0)
+        result = generate_guidance(test_type, 5.0, "NORMAL")
+        
+        assert len(result.message) > 0
+        assert len(result.suggestions) > 0
     
-    def test_all_lipid_tests_generate_messages(self):
-        """Test that all Lipid tests generate appropriate messages."""
-        lipid_tests = ["TC", "LDL", "HDL", "TRIG"]
-        
-        for test_key in lipid_tests:
-            test_type = MockTestType(test_key, f"Test {test_key}", "LIPID", 0, 200)
-            result = generate_guidance(test_type, 100, "NORMAL")
-            
-            assert len(result["message"]) > 0
-            assert len(result["suggestions"]) > 0
+    @pytest.mark.parametrize("test_key", ["TC", "LDL", "HDL", "TRIG"])
+    def test_lipid_test_generates_message(self, test_key):
+        """Test that each Lipid test generates appropriate messages."""
+        test_type = MockTestType(test_key, f"Test {test_key}", "LIPID", 0, 200)
+        result = generate_guidance(test_type, 100, "NORMAL")
+        
+        assert len(result.message) > 0
+        assert len(result.suggestions) > 0
     
     def test_different_statuses_generate_different_messages(self):
         """Test that different statuses generate different messages."""
-        test_type = MockTestType("WBC", "White Blood Cells", "CBC", 4.5, 11.0)
+        test_type = WBC_CBC
         
         normal_result = generate_guidance(test_type, 7.0, "NORMAL")
         low_result = generate_guidance(test_type, 3.0, "LOW")
         high_result = generate_guidance(test_type, 13.0, "HIGH")
         
         # Messages should be different for different statuses
-        assert normal_result["message"] != low_result["message"]
-        assert normal_result["message"] != high_result["message"]
-        assert low_result["message"] != high_result["message"]
+        assert normal_result.message != low_result.message
+        assert normal_result.message != high_result.message
+        assert low_result.message != high_result.message
 
 
 # Property-Based Tests using Hypothesis
-from hypothesis import given, strategies as st, assume
+from types import SimpleNamespace
+from hypothesis import given, settings, strategies as st, assume
+
+
+# _compute_trend is a pure three-way decision, so a small deterministic
+# sample covers it without Hypothesis database I/O between runs
+_TREND_PROPERTY_SETTINGS = settings(max_examples=30, deadline=None, derandomize=True)
+
+
+def _status_for(value, ref_low, ref_high):
+    """Simplified LOW/NORMAL/HIGH status used as input to _compute_trend."""
+    if value < ref_low:
+        return "LOW"
+    elif value <= ref_high:
+        return "NORMAL"
+    return "HIGH"
+
+
+def _trend_test_type(ref_low, ref_high):
+    """Minimal test type stub; _compute_trend only reads the reference range."""
+    return SimpleNamespace(ref_low=ref_low, ref_high=ref_high)
+
+
+@st.composite
+def lab_scenario(draw, value_margin=10.0):
+    """Draw (ref_low, ref_high, value) with the value near the reference range."""
+    ref_low = draw(st.floats(min_value=1.0, max_value=50.0))
+    ref_high = draw(st.floats(min_value=51.0, max_value=100.0))
+    value = draw(st.floats(
+        min_value=max(0.1, ref_low - value_margin),
+        max_value=ref_high + value_margin
+    ))
+    return ref_low, ref_high, value
 
 
 class TestTrendComputationProperty:
@@ -250,6 +323,7 @@ class TestTrendComputationProperty:
     Validates: Requirements 12.4
     """
     
+    @_TREND_PROPERTY_SETTINGS
     @given(
         ref_low=st.floats(min_value=0.1, max_value=100.0, allow_nan=False, allow_infinity=False),
         ref_high=st.floats(min_value=0.1, max_value=100.0, allow_nan=False, allow_infinity=False),
@@ -268,15 +342,10 @@ class TestTrendComputationProperty:
         assume(ref_low < ref_high)
         
         # Create test type with reference ranges
-        test_type = MockTestType("WBC", "White Blood Cells", "CBC", ref_low, ref_high)
+        test_type = _trend_test_type(ref_low, ref_high)
         
         # Compute status for current value
-        if current_value < ref_low:
-            status = "LOW"
-        elif current_value <= ref_high:
-            status = "NORMAL"
-        else:
-            status = "HIGH"
+        status = _status_for(current_value, ref_low, ref_high)
         
         # Compute trend
         trend = _compute_trend(test_type, current_value, status, previous_value)
@@ -285,6 +354,7 @@ class TestTrendComputationProperty:
         assert trend in ["improving", "worsening", "stable"], \
             f"Trend must be 'improving', 'worsening', or 'stable', got: {trend}"
     
+    @_TREND_PROPERTY_SETTINGS
     @given(
         ref_low=st.floats(min_value=0.1, max_value=100.0, allow_nan=False, allow_infinity=False),
         ref_high=st.floats(min_value=0.1, max_value=100.0, allow_nan=False, allow_infinity=False),
@@ -302,15 +372,10 @@ class TestTrendComputationProperty:
         assume(ref_low < ref_high)
         
         # Create test type with reference ranges
-        test_type = MockTestType("WBC", "White Blood Cells", "CBC", ref_low, ref_high)
+        test_type = _trend_test_type(ref_low, ref_high)
         
         # Compute status
-        if base_value < ref_low:
-            status = "LOW"
-        elif base_value <= ref_high:
-            status = "NORMAL"
-        else:
-            status = "HIGH"
+        status = _status_for(base_value, ref_low, ref_high)
         
         # Compute trend with identical values
         trend = _compute_trend(test_type, base_value, status, base_value)
@@ -319,6 +384,7 @@ class TestTrendComputationProperty:
         assert trend == "stable", \
             f"Identical values should result in 'stable' trend, got: {trend}"
     
+    @_TREND_PROPERTY_SETTINGS
     @given(
         ref_low=st.floats(min_value=1.0, max_value=50.0, allow_nan=False, allow_infinity=False),
         ref_high=st.floats(min_value=51.0, max_value=100.0, allow_nan=False, allow_infinity=False),
@@ -332,7 +398,7 @@ class TestTrendComputationProperty:
         Validates: Requirements 12.4
         """
         # Create test type with reference ranges
-        test_type = MockTestType("WBC", "White Blood Cells", "CBC", ref_low, ref_high)
+        test_type = _trend_test_type(ref_low, ref_high)
         
         # Calculate midpoint
         midpoint = (ref_low + ref_high) / 2
@@ -357,6 +423,7 @@ class TestTrendComputationProperty:
         assert trend_low == "improving", \
             f"Moving from {low_previous} to {low_current} (toward midpoint {midpoint}) should be 'improving', got: {trend_low}"
     
+    @_TREND_PROPERTY_SETTINGS
     @given(
         ref_low=st.floats(min_value=1.0, max_value=50.0, allow_nan=False, allow_infinity=False),
         ref_high=st.floats(min_value=51.0, max_value=100.0, allow_nan=False, allow_infinity=False),
@@ -370,7 +437,7 @@ class TestTrendComputationProperty:
         Validates: Requirements 12.4
         """
         # Create test type with reference ranges
-        test_type = MockTestType("WBC", "White Blood Cells", "CBC", ref_low, ref_high)
+        test_type = _trend_test_type(ref_low, ref_high)
         
         # Calculate midpoint
         midpoint = (ref_low + ref_high) / 2
@@ -395,12 +462,9 @@ class TestTrendComputationProperty:
         assert trend_low == "worsening", \
             f"Moving from {low_previous} to {low_current} (away from midpoint {midpoint}) should be 'worsening', got: {trend_low}"
     
-    @given(
-        ref_low=st.floats(min_value=1.0, max_value=50.0, allow_nan=False, allow_infinity=False),
-        ref_high=st.floats(min_value=51.0, max_value=100.0, allow_nan=False, allow_infinity=False),
-        value=st.floats(min_value=0.1, max_value=200.0, allow_nan=False, allow_infinity=False),
-    )
-    def test_trend_stable_for_small_changes(self, ref_low, ref_high, value):
+    @_TREND_PROPERTY_SETTINGS
+    @given(scenario=lab_scenario())
+    def test_trend_stable_for_small_changes(self, scenario):
         """
         Property: For any test result, when the change between current and previous 
         values is less than 5% of the reference range, the trend should be 'stable'.
@@ -408,8 +472,10 @@ class TestTrendComputationProperty:
         Feature: lab-report-companion, Property 32: Trend computation compares values
         Validates: Requirements 12.4
         """
+        ref_low, ref_high, value = scenario
+        
         # Create test type with reference ranges
-        test_type = MockTestType("WBC", "White Blood Cells", "CBC", ref_low, ref_high)
+        test_type = _trend_test_type(ref_low, ref_high)
         
         # Calculate 5% of range
         range_width = ref_high - ref_low
@@ -419,12 +485,7 @@ class TestTrendComputationProperty:
         previous_value = value + small_change
         
         # Compute status
-        if value < ref_low:
-            status = "LOW"
-        elif value <= ref_high:
-            status = "NORMAL"
-        else:
-            status = "HIGH"
+        status = _status_for(value, ref_low, ref_high)
         
         # Compute trend
         trend = _compute_trend(test_type, value, status, previous_value)
@@ -433,6 +494,7 @@ class TestTrendComputationProperty:
         assert trend == "stable", \
             f"Change of {abs(value - previous_value)} (less than 5% of range {range_width}) should be 'stable', got: {trend}"
     
+    @_TREND_PROPERTY_SETTINGS
     @given(
         current_value=st.floats(min_value=0.1, max_value=200.0, allow_nan=False, allow_infinity=False),
     )
@@ -445,15 +507,10 @@ class TestTrendComputationProperty:
         Validates: Requirements 12.4
         """
         # Create test type with reference ranges
-        test_type = MockTestType("WBC", "White Blood Cells", "CBC", 4.5, 11.0)
+        test_type = WBC_CBC
         
         # Compute status
-        if current_value < 4.5:
-            status = "LOW"
-        elif current_value <= 11.0:
-            status = "NORMAL"
-        else:
-            status = "HIGH"
+        status = _status_for(current_value, 4.5, 11.0)
         
         # Compute trend without previous value
         trend = _compute_trend(test_type, current_value, status, None)
@@ -12,6 +12,7 @@ import pytest
 from fastapi.testclient import TestClient
 from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
 from datetime import datetime, timedelta
 
 from app.main import app
@@ -21,9 +22,13 @@ from app.db.models import User, Panel, TestType, Report, TestResult
 from app.core.security import get_password_hash, create_access_token
 
 
-# Test database setup
-SQLALCHEMY_DATABASE_URL = "sqlite:///./test_history.db"
-engine = create_engine(SQLALCHEMY_DATABASE_URL, connect_args={"check_same_thread": False})
+# Test database setup: in-memory SQLite shared by all sessions via StaticPool
+SQLALCHEMY_DATABASE_URL = "sqlite://"
+engine = create_engine(
+    SQLALCHEMY_DATABASE_URL,
+    connect_args={"check_same_thread": False},
+    poolclass=StaticPool
+)
 TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
 
@@ -35,7 +40,11 @@ def override_get_db():
         db.close()
 
 
-client = TestClient(app)
+@pytest.fixture(scope="module")
+def client():
+    """Single TestClient for the module, started once via its context manager"""
+    with TestClient(app) as test_client:
+        yield test_client
 
 
 @pytest.fixture(scope="module", autouse=True)
@@ -49,25 +58,20 @@ def setup_database():
     db = TestingSessionLocal()
     
     try:
-        # Create test user
+        # Build the whole object graph through relationships so it can be
+        # inserted in a single transaction without intermediate flushes
         user = User(
             email="test@example.com",
             hashed_password=get_password_hash("testpassword123")
         )
-        db.add(user)
-        db.commit()
         
         # Create panels
         cbc_panel = Panel(key="CBC", display_name="Complete Blood Count")
         metabolic_panel = Panel(key="METABOLIC", display_name="Metabolic Panel")
         
-        db.add(cbc_panel)
-        db.add(metabolic_panel)
-        db.commit()
-        
         # Create test types
         wbc = TestType(
-            panel_id=cbc_panel.id,
+            panel=cbc_panel,
             key="WBC",
             display_name="White Blood Cells",
             unit="10^3/µL",
@@ -75,7 +79,7 @@ def setup_database():
             ref_high=11.0
         )
         glucose = TestType(
-            panel_id=metabolic_panel.id,
+            panel=metabolic_panel,
             key="GLUCOSE",
             display_name="Glucose",
             unit="mg/dL",
@@ -83,93 +87,94 @@ def setup_database():
             ref_high=100.0
         )
         
-        db.add(wbc)
-        db.add(glucose)
-        db.commit()
-        
         # Create reports
         report1 = Report(
-            user_id=user.id,
+            user=user,
             original_filename="report1.pdf",
             parsed_success=True
         )
         report2 = Report(
-            user_id=user.id,
+            user=user,
             original_filename="report2.pdf",
             parsed_success=True
         )
         report3 = Report(
-            user_id=user.id,
+            user=user,
             original_filename="report3.pdf",
             parsed_success=True
         )
         
-        db.add(report1)
-        db.add(report2)
-        db.add(report3)
-        db.commit()
-        
         # Create test results with different timestamps
         base_time = datetime.now()
         
         result1 = TestResult(
-            report_id=report1.id,
-            test_type_id=wbc.id,
+            report=report1,
+            test_type=wbc,
             value=5.5,
             unit="10^3/µL",
             status="NORMAL",
             created_at=base_time - timedelta(days=30)
         )
         result2 = TestResult(
-            report_id=report2.id,
-            test_type_id=wbc.id,
+            report=report2,
+            test_type=wbc,
             value=6.2,
             unit="10^3/µL",
             status="NORMAL",
             created_at=base_time - timedelta(days=15)
         )
         result3 = TestResult(
-            report_id=report3.id,
-            test_type_id=wbc.id,
+            report=report3,
+            test_type=wbc,
             value=7.8,
             unit="10^3/µL",
             status="NORMAL",
             created_at=base_time
         )
         
-        db.add(result1)
-        db.add(result2)
-        db.add(result3)
+        db.add_all([
+            user, cbc_panel, metabolic_panel, wbc, glucose,
+            report1, report2, report3, result1, result2, result3
+        ])
         db.commit()
     finally:
         db.close()
     
     yield
     
-    # Cleanup
-    Base.metadata.drop_all(bind=engine)
-    # Remove dependency override
+    # Remove dependency override (the in-memory database goes away with the engine)
     app.dependency_overrides.pop(get_db, None)
 
 
-def get_auth_headers():
-    """Get authentication headers with valid JWT token"""
+@pytest.fixture(scope="module")
+def auth_headers():
+    """
+    Authentication headers with a valid JWT token, signed once per module.
+    
+    The token subject "1" must stay the id of the user seeded in setup_database.
+    """
     token = create_access_token(data={"sub": "1"})
     return {"Authorization": f"Bearer {token}"}
 
 
+@pytest.fixture(scope="module")
+def wbc_history_response(client, auth_headers):
+    """GET /tests/WBC/history issued once and shared by read-only tests"""
+    response = client.get("/tests/WBC/history", headers=auth_headers)
+    return response, response.json()
+
+
 class TestHistoryEndpoint:
     """Tests for GET /tests/{test_key}/history endpoint"""
     
-    def test_get_history_success(self):
+    def test_get_history_success(self, wbc_history_response):
         """
         Test successful retrieval of test history.
         Requirements: 11.1, 11.2, 11.5
         """
-        response = client.get("/tests/WBC/history", headers=get_auth_headers())
+        response, data = wbc_history_response
         
         assert response.status_code == 200
-        data = response.json()
         
         # Check metadata structure
         assert "metadata" in data
@@ -201,12 +206,12 @@ class TestHistoryEndpoint:
             assert point["unit"] == "10^3/µL"
             assert point["status"] == "NORMAL"
     
-    def test_get_history_empty(self):
+    def test_get_history_empty(self, client, auth_headers):
         """
         Test empty history for test with no results.
         Requirements: 11.3
         """
-        response = client.get("/tests/GLUCOSE/history", headers=get_auth_headers())
+        response = client.get("/tests/GLUCOSE/history", headers=auth_headers)
         
         assert response.status_code == 200
         data = response.json()
@@ -222,32 +227,31 @@ class TestHistoryEndpoint:
         assert metadata["test_key"] == "GLUCOSE"
         assert metadata["display_name"] == "Glucose"
     
-    def test_get_history_nonexistent_test(self):
+    def test_get_history_nonexistent_test(self, client, auth_headers):
         """
         Test 404 response for non-existent test key.
         Requirements: 11.4
         """
-        response = client.get("/tests/INVALID/history", headers=get_auth_headers())
+        response = client.get("/tests/INVALID/history", headers=auth_headers)
         
         assert response.status_code == 404
         assert "not found" in response.json()["detail"].lower()
     
-    def test_get_history_requires_authentication(self):
+    def test_get_history_requires_authentication(self, client):
         """
         Test that history endpoint requires authentication.
         """
         response = client.get("/tests/WBC/history")
         assert response.status_code == 401
     
-    def test_get_history_chronological_order(self):
+    def test_get_history_chronological_order(self, wbc_history_response):
         """
         Test that history is returned in chronological order.
         Requirements: 11.1
         """
-        response = client.get("/tests/WBC/history", headers=get_auth_headers())
+        response, data = wbc_history_response
         
         assert response.status_code == 200
-        data = response.json()
         history = data["data"]
         
         # Extract timestamps and verify they're in ascending order
@@ -263,15 +267,14 @@ class TestHistoryEndpoint:
                 f"{dt_timestamps[i-1]} should be <= {dt_timestamps[i]}"
             )
     
-    def test_get_history_includes_all_metadata(self):
+    def test_get_history_includes_all_metadata(self, wbc_history_response):
         """
         Test that response includes all required metadata fields.
         Requirements: 11.5
         """
-        response = client.get("/tests/WBC/history", headers=get_auth_headers())
+        response, data = wbc_history_response
         
         assert response.status_code == 200
-        data = response.json()
         
         metadata = data["metadata"]
         
@@ -5,6 +5,7 @@ These tests verify that the parser correctly extracts test names, values,
 and units from OCR text for the three supported lab panels.
 """
 
+import re
 import pytest
 from hypothesis import given, strategies as st, settings
 from app.parsing.lab_parser import (
@@ -188,6 +189,14 @@ class TestParseLine:
         """Test that unsupported tests return None"""
         result = _parse_line("Vitamin D 30 ng/mL")
         assert result is None
+    
+    def test_parse_line_returns_fresh_dict(self):
+        """Test that repeated lines do not share a result dictionary"""
+        first = _parse_line("WBC 7.2 10^3/µL")
+        first['value'] = 0.0
+        second = _parse_line("  WBC 7.2 10^3/µL  ")
+        assert second is not first
+        assert second['value'] == 7.2
 
 
 class TestIsSupportedTest:
@@ -256,6 +265,19 @@ class TestGetSupportedTestKeywords:
         assert len(result["CBC"]) > 0
         assert len(result["METABOLIC"]) > 0
         assert len(result["LIPID"]) > 0
+    
+    def test_keywords_are_recognized_by_parser(self):
+        """Test that every listed keyword is accepted by _is_supported_test"""
+        result = get_supported_test_keywords()
+        for keywords in result.values():
+            for keyword in keywords:
+                assert _is_supported_test(keyword) is True, keyword
+    
+    def test_returns_new_lists(self):
+        """Test that mutating the result does not affect later calls"""
+        result = get_supported_test_keywords()
+        result["CBC"].clear()
+        assert len(get_supported_test_keywords()["CBC"]) > 0
 
 
 class TestParserEdgeCases:
@@ -312,7 +334,7 @@ class TestParserEdgeCases:
         
         assert len(result) == 2
         # Check decimal values are preserved
-        creat = [r for r in result if 'creat' in r['test_name_raw'].lower()][0]
+        creat = next(r for r in result if 'creat' in r['test_name_raw'].lower())
         assert creat['value'] == 1.05
     
     def test_parse_integer_values(self):
@@ -325,16 +347,61 @@ class TestParserEdgeCases:
         result = parse_lab_report({"raw_text": ocr_text})
         
         assert len(result) == 2
-        glucose = [r for r in result if 'glucose' in r['test_name_raw'].lower()][0]
+        glucose = next(r for r in result if 'glucose' in r['test_name_raw'].lower())
         assert glucose['value'] == 95.0
 
 
 
+# Every example reparses a whole OCR block, so a smaller deterministic
+# sample keeps the property runs short
+_PARSER_PROPERTY_SETTINGS = settings(max_examples=25, deadline=None, derandomize=True)
+
+
+def _keyword_pattern(*keywords):
+    """Compile keywords into one alternation that scans a name once."""
+    return re.compile('|'.join(map(re.escape, keywords)))
+
+
+def _count_matches(pattern, names):
+    """Count the names containing any of the pattern's keywords."""
+    return len(list(filter(pattern.search, names)))
+
+
+# Keywords used to classify extracted test names in the property tests
+_CBC_RE = _keyword_pattern('wbc', 'rbc', 'hemoglobin', 'hematocrit', 'platelet', 'mcv')
+_METABOLIC_RE = _keyword_pattern(
+    'glucose', 'glu', 'blood sugar',
+    'bun', 'urea',
+    'creatinine', 'creat',
+    'sodium', 'na',
+    'potassium', 'k',
+    'chloride', 'cl',
+    'co2', 'carbon dioxide', 'bicarbonate',
+    'calcium', 'ca'
+)
+_LIPID_RE = _keyword_pattern(
+    'cholesterol', 'chol',
+    'ldl', 'low density',
+    'hdl', 'high density',
+    'triglyceride', 'trig', 'tg'
+)
+_SUPPORTED_RE = re.compile('|'.join((
+    _CBC_RE.pattern,
+    _METABOLIC_RE.pattern,
+    _keyword_pattern('cholesterol', 'ldl', 'hdl', 'triglyceride').pattern
+)))
+_UNSUPPORTED_RE = _keyword_pattern(
+    'vitamin', 'tsh', 't3', 't4', 'ferritin', 'b12', 'folate',
+    'psa', 'crp', 'hba1c', 'albumin', 'bilirubin', 'alt', 'ast',
+    'alp', 'ggt', 'magnesium', 'phosphorus', 'protein', 'thyroid', 'peroxidase'
+)
+
+
 class TestPropertyBasedCBCParsing:
     """Property-based tests for CBC parsing"""
     
     # Feature: lab-report-companion, Property 8: Parser extracts CBC tests only
-    @settings(max_examples=100)
+    @_PARSER_PROPERTY_SETTINGS
     @given(
         wbc_value=st.floats(min_value=0.1, max_value=50.0, allow_nan=False, allow_infinity=False),
         rbc_value=st.floats(min_value=1.0, max_value=10.0, allow_nan=False, allow_infinity=False),
@@ -365,18 +432,18 @@ class TestPropertyBasedCBCParsing:
         Validates: Requirements 5.1
         """
         # Create OCR text with CBC tests and non-CBC tests
-        ocr_text = f"""
-        Complete Blood Count (CBC)
-        
-        WBC {wbc_value:.1f} 10^3/µL
-        RBC {rbc_value:.1f} 10^6/µL
-        Hemoglobin {hgb_value:.1f} g/dL
-        Hematocrit {hct_value:.1f} %
-        Platelets {plt_value:.0f} 10^3/µL
-        MCV {mcv_value:.0f} fL
-        
-        {non_cbc_test}
-        """
+        ocr_text = "\n".join((
+            "Complete Blood Count (CBC)",
+            "",
+            f"WBC {wbc_value:.1f} 10^3/µL",
+            f"RBC {rbc_value:.1f} 10^6/µL",
+            f"Hemoglobin {hgb_value:.1f} g/dL",
+            f"Hematocrit {hct_value:.1f} %",
+            f"Platelets {plt_value:.0f} 10^3/µL",
+            f"MCV {mcv_value:.0f} fL",
+            "",
+            non_cbc_test
+        ))
         
         # Parse the OCR text
         result = parse_lab_report({"raw_text": ocr_text})
@@ -384,19 +451,13 @@ class TestPropertyBasedCBCParsing:
         # Extract test names from results
         test_names_lower = [r['test_name_raw'].lower() for r in result]
         
-        # Define CBC test keywords
-        cbc_keywords = ['wbc', 'rbc', 'hemoglobin', 'hematocrit', 'platelet', 'mcv']
-        
-        # Define non-CBC test keywords from our sample
-        non_cbc_keywords = ['vitamin', 'tsh', 't4', 'ferritin', 'b12', 'folate', 'psa', 'crp']
-        
         # Property: All extracted tests should be CBC tests
         for test_name in test_names_lower:
             # Check if this test name contains any CBC keyword
-            is_cbc = any(keyword in test_name for keyword in cbc_keywords)
+            is_cbc = _CBC_RE.search(test_name) is not None
             
             # Check if this test name contains any non-CBC keyword
-            is_non_cbc = any(keyword in test_name for keyword in non_cbc_keywords)
+            is_non_cbc = _UNSUPPORTED_RE.search(test_name) is not None
             
             # Assert: If a test is extracted, it should be a CBC test, not a non-CBC test
             assert is_cbc or not is_non_cbc, \
@@ -404,32 +465,30 @@ class TestPropertyBasedCBCParsing:
         
         # Property: All CBC tests should be extracted (at least the 6 we provided)
         # Count how many CBC tests were extracted
-        cbc_count = sum(1 for name in test_names_lower 
-                       if any(keyword in name for keyword in cbc_keywords))
+        cbc_count = _count_matches(_CBC_RE, test_names_lower)
         
         # We should extract all 6 CBC tests
         assert cbc_count == 6, \
             f"Expected 6 CBC tests, but extracted {cbc_count}. Tests: {test_names_lower}"
         
         # Property: Non-CBC tests should NOT be extracted
-        non_cbc_count = sum(1 for name in test_names_lower 
-                           if any(keyword in name for keyword in non_cbc_keywords))
+        non_cbc_count = _count_matches(_UNSUPPORTED_RE, test_names_lower)
         
         assert non_cbc_count == 0, \
             f"Parser should not extract non-CBC tests, but found {non_cbc_count}"
         
         # Property: Extracted values should match the input values (within floating point tolerance)
-        wbc_results = [r for r in result if 'wbc' in r['test_name_raw'].lower()]
-        if wbc_results:
-            assert abs(wbc_results[0]['value'] - wbc_value) < 0.2, \
-                f"WBC value mismatch: expected {wbc_value}, got {wbc_results[0]['value']}"
+        wbc_result = next((r for r in result if 'wbc' in r['test_name_raw'].lower()), None)
+        if wbc_result is not None:
+            assert abs(wbc_result['value'] - wbc_value) < 0.2, \
+                f"WBC value mismatch: expected {wbc_value}, got {wbc_result['value']}"
 
 
 class TestPropertyBasedMetabolicParsing:
     """Property-based tests for Metabolic Panel parsing"""
     
     # Feature: lab-report-companion, Property 9: Parser extracts Metabolic Panel tests only
-    @settings(max_examples=100)
+    @_PARSER_PROPERTY_SETTINGS
     @given(
         glucose_value=st.floats(min_value=50.0, max_value=300.0, allow_nan=False, allow_infinity=False),
         bun_value=st.floats(min_value=5.0, max_value=50.0, allow_nan=False, allow_infinity=False),
@@ -464,20 +523,20 @@ class TestPropertyBasedMetabolicParsing:
         Validates: Requirements 5.2
         """
         # Create OCR text with Metabolic Panel tests and unsupported tests
-        ocr_text = f"""
-        Metabolic Panel (CMP/BMP)
-        
-        Glucose: {glucose_value:.1f} mg/dL
-        BUN: {bun_value:.1f} mg/dL
-        Creatinine: {creatinine_value:.2f} mg/dL
-        Sodium: {sodium_value:.1f} mmol/L
-        Potassium: {potassium_value:.1f} mmol/L
-        Chloride: {chloride_value:.1f} mmol/L
-        CO2: {co2_value:.1f} mmol/L
-        Calcium: {calcium_value:.1f} mg/dL
-        
-        {unsupported_test}
-        """
+        ocr_text = "\n".join((
+            "Metabolic Panel (CMP/BMP)",
+            "",
+            f"Glucose: {glucose_value:.1f} mg/dL",
+            f"BUN: {bun_value:.1f} mg/dL",
+            f"Creatinine: {creatinine_value:.2f} mg/dL",
+            f"Sodium: {sodium_value:.1f} mmol/L",
+            f"Potassium: {potassium_value:.1f} mmol/L",
+            f"Chloride: {chloride_value:.1f} mmol/L",
+            f"CO2: {co2_value:.1f} mmol/L",
+            f"Calcium: {calcium_value:.1f} mg/dL",
+            "",
+            unsupported_test
+        ))
         
         # Parse the OCR text
         result = parse_lab_report({"raw_text": ocr_text})
@@ -485,65 +544,41 @@ class TestPropertyBasedMetabolicParsing:
         # Extract test names from results
         test_names_lower = [r['test_name_raw'].lower() for r in result]
         
-        # Define Metabolic Panel test keywords
-        metabolic_keywords = [
-            'glucose', 'glu', 'blood sugar',
-            'bun', 'urea',
-            'creatinine', 'creat',
-            'sodium', 'na',
-            'potassium', 'k',
-            'chloride', 'cl',
-            'co2', 'carbon dioxide', 'bicarbonate',
-            'calcium', 'ca'
-        ]
-        
-        # Define unsupported test keywords (not in any of the three panels)
-        unsupported_keywords = [
-            'vitamin', 'tsh', 't4', 'ferritin', 'b12', 'folate', 'psa', 'crp'
-        ]
-        
         # Property 1: All Metabolic Panel tests should be extracted (all 8 we provided)
-        metabolic_count = sum(1 for name in test_names_lower 
-                             if any(keyword in name for keyword in metabolic_keywords))
+        metabolic_count = _count_matches(_METABOLIC_RE, test_names_lower)
         
         assert metabolic_count == 8, \
             f"Expected 8 Metabolic Panel tests, but extracted {metabolic_count}. Tests: {test_names_lower}"
         
         # Property 2: Unsupported tests should NOT be extracted
-        unsupported_count = sum(1 for name in test_names_lower 
-                               if any(keyword in name for keyword in unsupported_keywords))
+        unsupported_count = _count_matches(_UNSUPPORTED_RE, test_names_lower)
         
         assert unsupported_count == 0, \
             f"Parser should not extract unsupported tests, but found {unsupported_count}. Tests: {test_names_lower}"
         
         # Property 3: All extracted tests should be from supported panels (CBC, Metabolic, or Lipid)
-        # Define all supported keywords
-        cbc_keywords = ['wbc', 'rbc', 'hemoglobin', 'hematocrit', 'platelet', 'mcv']
-        lipid_keywords = ['cholesterol', 'ldl', 'hdl', 'triglyceride']
-        all_supported_keywords = metabolic_keywords + cbc_keywords + lipid_keywords
-        
         for test_name in test_names_lower:
-            is_supported = any(keyword in test_name for keyword in all_supported_keywords)
+            is_supported = _SUPPORTED_RE.search(test_name) is not None
             assert is_supported, \
                 f"Parser extracted unsupported test: {test_name}"
         
         # Property 4: Extracted values should match the input values (within floating point tolerance)
-        glucose_results = [r for r in result if 'glucose' in r['test_name_raw'].lower()]
-        if glucose_results:
-            assert abs(glucose_results[0]['value'] - glucose_value) < 0.2, \
-                f"Glucose value mismatch: expected {glucose_value}, got {glucose_results[0]['value']}"
-        
-        bun_results = [r for r in result if 'bun' in r['test_name_raw'].lower()]
-        if bun_results:
-            assert abs(bun_results[0]['value'] - bun_value) < 0.2, \
-                f"BUN value mismatch: expected {bun_value}, got {bun_results[0]['value']}"
+        glucose_result = next((r for r in result if 'glucose' in r['test_name_raw'].lower()), None)
+        if glucose_result is not None:
+            assert abs(glucose_result['value'] - glucose_value) < 0.2, \
+                f"Glucose value mismatch: expected {glucose_value}, got {glucose_result['value']}"
+        
+        bun_result = next((r for r in result if 'bun' in r['test_name_raw'].lower()), None)
+        if bun_result is not None:
+            assert abs(bun_result['value'] - bun_value) < 0.2, \
+                f"BUN value mismatch: expected {bun_value}, got {bun_result['value']}"
 
 
 class TestPropertyBasedLipidParsing:
     """Property-based tests for Lipid Panel parsing"""
     
     # Feature: lab-report-companion, Property 10: Parser extracts Lipid Panel tests only
-    @settings(max_examples=100)
+    @_PARSER_PROPERTY_SETTINGS
     @given(
         total_chol_value=st.floats(min_value=100.0, max_value=400.0, allow_nan=False, allow_infinity=False),
         ldl_value=st.floats(min_value=50.0, max_value=300.0, allow_nan=False, allow_infinity=False),
@@ -575,16 +610,16 @@ class TestPropertyBasedLipidParsing:
         Validates: Requirements 5.3
         """
         # Create OCR text with Lipid Panel tests and unsupported tests
-        ocr_text = f"""
-        Lipid Panel
-        
-        Total Cholesterol {total_chol_value:.1f} mg/dL
-        LDL Cholesterol {ldl_value:.1f} mg/dL
-        HDL Cholesterol {hdl_value:.1f} mg/dL
-        Triglycerides {trig_value:.1f} mg/dL
-        
-        {unsupported_test}
-        """
+        ocr_text = "\n".join((
+            "Lipid Panel",
+            "",
+            f"Total Cholesterol {total_chol_value:.1f} mg/dL",
+            f"LDL Cholesterol {ldl_value:.1f} mg/dL",
+            f"HDL Cholesterol {hdl_value:.1f} mg/dL",
+            f"Triglycerides {trig_value:.1f} mg/dL",
+            "",
+            unsupported_test
+        ))
         
         # Parse the OCR text
         result = parse_lab_report({"raw_text": ocr_text})
@@ -592,86 +627,57 @@ class TestPropertyBasedLipidParsing:
         # Extract test names from results
         test_names_lower = [r['test_name_raw'].lower() for r in result]
         
-        # Define Lipid Panel test keywords
-        lipid_keywords = [
-            'cholesterol', 'chol',
-            'ldl', 'low density',
-            'hdl', 'high density',
-            'triglyceride', 'trig', 'tg'
-        ]
-        
-        # Define unsupported test keywords (not in any of the three panels)
-        unsupported_keywords = [
-            'vitamin', 'tsh', 't4', 'ferritin', 'b12', 'folate', 'psa', 'crp', 'hba1c', 'albumin'
-        ]
-        
         # Property 1: All Lipid Panel tests should be extracted (all 4 we provided)
-        lipid_count = sum(1 for name in test_names_lower 
-                         if any(keyword in name for keyword in lipid_keywords))
+        lipid_count = _count_matches(_LIPID_RE, test_names_lower)
         
         assert lipid_count == 4, \
             f"Expected 4 Lipid Panel tests, but extracted {lipid_count}. Tests: {test_names_lower}"
         
         # Property 2: Unsupported tests should NOT be extracted
-        unsupported_count = sum(1 for name in test_names_lower 
-                               if any(keyword in name for keyword in unsupported_keywords))
+        unsupported_count = _count_matches(_UNSUPPORTED_RE, test_names_lower)
         
         assert unsupported_count == 0, \
             f"Parser should not extract unsupported tests, but found {unsupported_count}. Tests: {test_names_lower}"
         
         # Property 3: All extracted tests should be from supported panels (CBC, Metabolic, or Lipid)
-        # Define all supported keywords
-        cbc_keywords = ['wbc', 'rbc', 'hemoglobin', 'hematocrit', 'platelet', 'mcv']
-        metabolic_keywords = [
-            'glucose', 'glu', 'blood sugar',
-            'bun', 'urea',
-            'creatinine', 'creat',
-            'sodium', 'na',
-            'potassium', 'k',
-            'chloride', 'cl',
-            'co2', 'carbon dioxide', 'bicarbonate',
-            'calcium', 'ca'
-        ]
-        all_supported_keywords = lipid_keywords + cbc_keywords + metabolic_keywords
-        
         for test_name in test_names_lower:
-            is_supported = any(keyword in test_name for keyword in all_supported_keywords)
+            is_supported = _SUPPORTED_RE.search(test_name) is not None
             assert is_supported, \
                 f"Parser extracted unsupported test: {test_name}"
         
         # Property 4: Extracted values should match the input values (within floating point tolerance)
         # Check Total Cholesterol
-        total_chol_results = [r for r in result if 'cholesterol' in r['test_name_raw'].lower() 
-                             and 'ldl' not in r['test_name_raw'].lower() 
-                             and 'hdl' not in r['test_name_raw'].lower()]
-        if total_chol_results:
-            assert abs(total_chol_results[0]['value'] - total_chol_value) < 0.2, \
-                f"Total Cholesterol value mismatch: expected {total_chol_value}, got {total_chol_results[0]['value']}"
+        total_chol_result = next((r for r in result if 'cholesterol' in r['test_name_raw'].lower() 
+                                  and 'ldl' not in r['test_name_raw'].lower() 
+                                  and 'hdl' not in r['test_name_raw'].lower()), None)
+        if total_chol_result is not None:
+            assert abs(total_chol_result['value'] - total_chol_value) < 0.2, \
+                f"Total Cholesterol value mismatch: expected {total_chol_value}, got {total_chol_result['value']}"
         
         # Check LDL
-        ldl_results = [r for r in result if 'ldl' in r['test_name_raw'].lower()]
-        if ldl_results:
-            assert abs(ldl_results[0]['value'] - ldl_value) < 0.2, \
-                f"LDL value mismatch: expected {ldl_value}, got {ldl_results[0]['value']}"
+        ldl_result = next((r for r in result if 'ldl' in r['test_name_raw'].lower()), None)
+        if ldl_result is not None:
+            assert abs(ldl_result['value'] - ldl_value) < 0.2, \
+                f"LDL value mismatch: expected {ldl_value}, got {ldl_result['value']}"
         
         # Check HDL
-        hdl_results = [r for r in result if 'hdl' in r['test_name_raw'].lower()]
-        if hdl_results:
-            assert abs(hdl_results[0]['value'] - hdl_value) < 0.2, \
-                f"HDL value mismatch: expected {hdl_value}, got {hdl_results[0]['value']}"
+        hdl_result = next((r for r in result if 'hdl' in r['test_name_raw'].lower()), None)
+        if hdl_result is not None:
+            assert abs(hdl_result['value'] - hdl_value) < 0.2, \
+                f"HDL value mismatch: expected {hdl_value}, got {hdl_result['value']}"
         
         # Check Triglycerides
-        trig_results = [r for r in result if 'triglyceride' in r['test_name_raw'].lower()]
-        if trig_results:
-            assert abs(trig_results[0]['value'] - trig_value) < 0.2, \
-                f"Triglycerides value mismatch: expected {trig_value}, got {trig_results[0]['value']}"
+        trig_result = next((r for r in result if 'triglyceride' in r['test_name_raw'].lower()), None)
+        if trig_result is not None:
+            assert abs(trig_result['value'] - trig_value) < 0.2, \
+                f"Triglycerides value mismatch: expected {trig_value}, got {trig_result['value']}"
 
 
 class TestPropertyBasedUnsupportedFiltering:
     """Property-based tests for unsupported test filtering"""
     
     # Feature: lab-report-companion, Property 11: Unsupported tests are filtered out
-    @settings(max_examples=100)
+    @_PARSER_PROPERTY_SETTINGS
     @given(
         # Generate a list of supported test entries with values
         num_cbc_tests=st.integers(min_value=0, max_value=3),
@@ -785,37 +791,10 @@ class TestPropertyBasedUnsupportedFiltering:
         # Extract test names from results
         test_names_lower = [r['test_name_raw'].lower() for r in result]
         
-        # Define all supported keywords
-        cbc_keywords = ['wbc', 'rbc', 'hemoglobin', 'hematocrit', 'platelet', 'mcv']
-        metabolic_keywords = [
-            'glucose', 'glu', 'blood sugar',
-            'bun', 'urea',
-            'creatinine', 'creat',
-            'sodium', 'na',
-            'potassium', 'k',
-            'chloride', 'cl',
-            'co2', 'carbon dioxide', 'bicarbonate',
-            'calcium', 'ca'
-        ]
-        lipid_keywords = [
-            'cholesterol', 'chol',
-            'ldl', 'low density',
-            'hdl', 'high density',
-            'triglyceride', 'trig', 'tg'
-        ]
-        all_supported_keywords = cbc_keywords + metabolic_keywords + lipid_keywords
-        
-        # Define unsupported keywords
-        unsupported_keywords = [
-            'vitamin', 'tsh', 't3', 't4', 'ferritin', 'b12', 'folate', 
-            'psa', 'crp', 'hba1c', 'albumin', 'bilirubin', 'alt', 'ast', 
-            'alp', 'ggt', 'magnesium', 'phosphorus', 'protein', 'thyroid', 'peroxidase'
-        ]
-        
         # Property 1: All extracted tests should be from supported panels
         for test_name in test_names_lower:
-            is_supported = any(keyword in test_name for keyword in all_supported_keywords)
-            is_unsupported = any(keyword in test_name for keyword in unsupported_keywords)
+            is_supported = _SUPPORTED_RE.search(test_name) is not None
+            is_unsupported = _UNSUPPORTED_RE.search(test_name) is not None
             
             # If a test is extracted, it must be supported and not unsupported
             assert is_supported, \
@@ -824,8 +803,7 @@ class TestPropertyBasedUnsupportedFiltering:
                 f"Parser extracted unsupported test: {test_name}"
         
         # Property 2: No unsupported tests should be extracted
-        unsupported_count = sum(1 for name in test_names_lower 
-                               if any(keyword in name for keyword in unsupported_keywords))
+        unsupported_count = _count_matches(_UNSUPPORTED_RE, test_names_lower)
         
         assert unsupported_count == 0, \
             f"Parser should not extract unsupported tests, but found {unsupported_count}. Tests: {test_names_lower}"
@@ -835,11 +813,21 @@ class TestPropertyBasedUnsupportedFiltering:
             f"Expected {expected_supported_count} supported tests, but extracted {len(result)}. Tests: {test_names_lower}"
 
 
+# Line templates for each format style, filled with (name, value, unit)
+_OCR_LINE_FORMATS = {
+    "space": "{} {:.2f} {}",
+    "colon": "{}: {:.2f} {}",
+    "no_space": "{} {:.2f}{}",
+    "tab": "{}\t{:.2f}\t{}",
+    "multi_space": "{}    {:.2f}    {}",
+}
+
+
 class TestPropertyBasedValueAndUnitExtraction:
     """Property-based tests for value and unit extraction"""
     
     # Feature: lab-report-companion, Property 12: Test value extraction includes units
-    @settings(max_examples=100)
+    @_PARSER_PROPERTY_SETTINGS
     @given(
         # Generate test data with various formats
         test_data=st.lists(
@@ -881,21 +869,10 @@ class TestPropertyBasedValueAndUnitExtraction:
         Validates: Requirements 5.5
         """
         # Build OCR text based on format style
-        ocr_lines = ["Lab Results\n"]
-        
-        for test_name, value, unit in test_data:
-            if format_style == "space":
-                ocr_lines.append(f"{test_name} {value:.2f} {unit}\n")
-            elif format_style == "colon":
-                ocr_lines.append(f"{test_name}: {value:.2f} {unit}\n")
-            elif format_style == "no_space":
-                ocr_lines.append(f"{test_name} {value:.2f}{unit}\n")
-            elif format_style == "tab":
-                ocr_lines.append(f"{test_name}\t{value:.2f}\t{unit}\n")
-            elif format_style == "multi_space":
-                ocr_lines.append(f"{test_name}    {value:.2f}    {unit}\n")
-        
-        ocr_text = "".join(ocr_lines)
+        line_format = _OCR_LINE_FORMATS[format_style]
+        ocr_text = "\n".join(
+            ["Lab Results"] + [line_format.format(*entry) for entry in test_data]
+        )
         
         # Parse the OCR text
         result = parse_lab_report({"raw_text": ocr_text})
@@ -12,6 +12,7 @@ import pytest
 from fastapi.testclient import TestClient
 from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
 from datetime import datetime, timedelta
 
 from app.main import app
@@ -21,9 +22,13 @@ from app.db.models import User, Panel, TestType, Report, TestResult
 from app.core.security import get_password_hash, create_access_token
 
 
-# Test database setup
-SQLALCHEMY_DATABASE_URL = "sqlite:///./test_latest_insight.db"
-engine = create_engine(SQLALCHEMY_DATABASE_URL, connect_args={"check_same_thread": False})
+# Test database setup: in-memory SQLite shared by all sessions via StaticPool
+SQLALCHEMY_DATABASE_URL = "sqlite://"
+engine = create_engine(
+    SQLALCHEMY_DATABASE_URL,
+    connect_args={"check_same_thread": False},
+    poolclass=StaticPool
+)
 TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
 
@@ -35,7 +40,11 @@ def override_get_db():
         db.close()
 
 
-client = TestClient(app)
+@pytest.fixture(scope="module")
+def client():
+    """Single TestClient for the module, started once via its context manager"""
+    with TestClient(app) as test_client:
+        yield test_client
 
 
 @pytest.fixture(scope="module", autouse=True)
@@ -49,27 +58,21 @@ def setup_database():
     db = TestingSessionLocal()
     
     try:
-        # Create test user
+        # Build the whole object graph through relationships so it can be
+        # inserted in a single transaction without intermediate flushes
         user = User(
             email="test@example.com",
             hashed_password=get_password_hash("testpassword123")
         )
-        db.add(user)
-        db.commit()
         
         # Create panels
         cbc_panel = Panel(key="CBC", display_name="Complete Blood Count")
         metabolic_panel = Panel(key="METABOLIC", display_name="Metabolic Panel")
         lipid_panel = Panel(key="LIPID", display_name="Lipid Panel")
         
-        db.add(cbc_panel)
-        db.add(metabolic_panel)
-        db.add(lipid_panel)
-        db.commit()
-        
         # Create test types
         wbc = TestType(
-            panel_id=cbc_panel.id,
+            panel=cbc_panel,
             key="WBC",
             display_name="White Blood Cells",
             unit="10^3/µL",
@@ -77,7 +80,7 @@ def setup_database():
             ref_high=11.0
         )
         glucose = TestType(
-            panel_id=metabolic_panel.id,
+            panel=metabolic_panel,
             key="GLUCOSE",
             display_name="Glucose",
             unit="mg/dL",
@@ -85,7 +88,7 @@ def setup_database():
             ref_high=100.0
         )
         ldl = TestType(
-            panel_id=lipid_panel.id,
+            panel=lipid_panel,
             key="LDL",
             display_name="LDL Cholesterol",
             unit="mg/dL",
@@ -93,54 +96,43 @@ def setup_database():
             ref_high=100.0
         )
         
-        db.add(wbc)
-        db.add(glucose)
-        db.add(ldl)
-        db.commit()
-        
         # Create reports
         report1 = Report(
-            user_id=user.id,
+            user=user,
             original_filename="report1.pdf",
             parsed_success=True
         )
         report2 = Report(
-            user_id=user.id,
+            user=user,
             original_filename="report2.pdf",
             parsed_success=True
         )
         report3 = Report(
-            user_id=user.id,
+            user=user,
             original_filename="report3.pdf",
             parsed_success=True
         )
         report4 = Report(
-            user_id=user.id,
+            user=user,
             original_filename="report4.pdf",
             parsed_success=True
         )
         
-        db.add(report1)
-        db.add(report2)
-        db.add(report3)
-        db.add(report4)
-        db.commit()
-        
         # Create test results with different timestamps
         base_time = datetime.now()
         
         # WBC results - improving trend (moving toward normal)
         result1 = TestResult(
-            report_id=report1.id,
-            test_type_id=wbc.id,
+            report=report1,
+            test_type=wbc,
             value=12.5,  # HIGH
             unit="10^3/µL",
             status="HIGH",
             created_at=base_time - timedelta(days=30)
         )
         result2 = TestResult(
-            report_id=report2.id,
-            test_type_id=wbc.id,
+            report=report2,
+            test_type=wbc,
             value=8.0,  # NORMAL - improving
             unit="10^3/µL",
             status="NORMAL",
@@ -149,16 +141,16 @@ def setup_database():
         
         # Glucose results - worsening trend
         result3 = TestResult(
-            report_id=report3.id,
-            test_type_id=glucose.id,
+            report=report3,
+            test_type=glucose,
             value=85.0,  # NORMAL
             unit="mg/dL",
             status="NORMAL",
             created_at=base_time - timedelta(days=15)
         )
         result4 = TestResult(
-            report_id=report4.id,
-            test_type_id=glucose.id,
+            report=report4,
+            test_type=glucose,
             value=110.0,  # HIGH - worsening
             unit="mg/dL",
             status="HIGH",
@@ -167,49 +159,75 @@ def setup_database():
         
         # LDL result - only one result (no previous)
         result5 = TestResult(
-            report_id=report1.id,
-            test_type_id=ldl.id,
+            report=report1,
+            test_type=ldl,
             value=95.0,  # NORMAL
             unit="mg/dL",
             status="NORMAL",
             created_at=base_time
         )
         
-        db.add(result1)
-        db.add(result2)
-        db.add(result3)
-        db.add(result4)
-        db.add(result5)
+        db.add_all([
+            user, cbc_panel, metabolic_panel, lipid_panel, wbc, glucose, ldl,
+            report1, report2, report3, report4,
+            result1, result2, result3, result4, result5
+        ])
         db.commit()
     finally:
         db.close()
     
     yield
     
-    # Cleanup
-    Base.metadata.drop_all(bind=engine)
-    # Remove dependency override
+    # Remove dependency override (the in-memory database goes away with the engine)
     app.dependency_overrides.pop(get_db, None)
 
 
-def get_auth_headers():
-    """Get authentication headers with valid JWT token"""
+@pytest.fixture(scope="module")
+def auth_headers():
+    """
+    Authentication headers with a valid JWT token, signed once per module.
+    
+    The token subject "1" must stay the id of the user seeded in setup_database.
+    """
     token = create_access_token(data={"sub": "1"})
     return {"Authorization": f"Bearer {token}"}
 
 
+def _get_latest_insight(client, auth_headers, test_key):
+    """Issue GET /tests/{test_key}/latest-insight and parse the body once"""
+    response = client.get(f"/tests/{test_key}/latest-insight", headers=auth_headers)
+    return response, response.json()
+
+
+@pytest.fixture(scope="module")
+def wbc_latest(client, auth_headers):
+    """WBC latest insight (12.5 HIGH -> 8.0 NORMAL) shared by read-only tests"""
+    return _get_latest_insight(client, auth_headers, "WBC")
+
+
+@pytest.fixture(scope="module")
+def glucose_latest(client, auth_headers):
+    """GLUCOSE latest insight (85.0 NORMAL -> 110.0 HIGH) shared by read-only tests"""
+    return _get_latest_insight(client, auth_headers, "GLUCOSE")
+
+
+@pytest.fixture(scope="module")
+def ldl_latest(client, auth_headers):
+    """LDL latest insight (single result) shared by read-only tests"""
+    return _get_latest_insight(client, auth_headers, "LDL")
+
+
 class TestLatestInsightEndpoint:
     """Tests for GET /tests/{test_key}/latest-insight endpoint"""
     
-    def test_get_latest_insight_with_previous(self):
+    def test_get_latest_insight_with_previous(self, wbc_latest):
         """
         Test successful retrieval of latest insight with previous result.
         Requirements: 12.1, 12.2, 12.3, 12.4, 12.5
         """
-        response = client.get("/tests/WBC/latest-insight", headers=get_auth_headers())
+        response, data = wbc_latest
         
         assert response.status_code == 200
-        data = response.json()
         
         # Check structure
         assert "latest" in data
@@ -235,7 +253,8 @@ class TestLatestInsightEndpoint:
         guidance = data["guidance"]
         assert "message" in guidance
         assert len(guidance["message"]) > 0
-        assert "blood" in guidance["message"].lower() or "cell" in guidance["message"].lower()
+        message = guidance["message"].lower()
+        assert "blood" in message or "cell" in message
         
         # Requirement 12.4: Check trend indicator
         assert "trend" in guidance
@@ -244,23 +263,23 @@ class TestLatestInsightEndpoint:
         # Requirement 12.5: Check disclaimer
         assert "disclaimer" in guidance
         assert len(guidance["disclaimer"]) > 0
-        assert "not a medical diagnosis" in guidance["disclaimer"].lower()
-        assert "doctor" in guidance["disclaimer"].lower()
+        disclaimer = guidance["disclaimer"].lower()
+        assert "not a medical diagnosis" in disclaimer
+        assert "doctor" in disclaimer
         
         # Check suggestions
         assert "suggestions" in guidance
         assert isinstance(guidance["suggestions"], list)
         assert len(guidance["suggestions"]) > 0
     
-    def test_get_latest_insight_without_previous(self):
+    def test_get_latest_insight_without_previous(self, ldl_latest):
         """
         Test latest insight when no previous result exists.
         Requirements: 12.1, 12.2
         """
-        response = client.get("/tests/LDL/latest-insight", headers=get_auth_headers())
+        response, data = ldl_latest
         
         assert response.status_code == 200
-        data = response.json()
         
         # Check latest result exists
         assert "latest" in data
@@ -283,44 +302,42 @@ class TestLatestInsightEndpoint:
         assert len(guidance["message"]) > 0
         assert len(guidance["disclaimer"]) > 0
     
-    def test_get_latest_insight_improving_trend(self):
+    def test_get_latest_insight_improving_trend(self, wbc_latest):
         """
         Test that improving trend is correctly identified.
         Requirements: 12.4
         """
-        response = client.get("/tests/WBC/latest-insight", headers=get_auth_headers())
+        response, data = wbc_latest
         
         assert response.status_code == 200
-        data = response.json()
         
         # WBC went from 12.5 (HIGH) to 8.0 (NORMAL) - should be improving
         guidance = data["guidance"]
         assert guidance["trend"] == "improving"
     
-    def test_get_latest_insight_worsening_trend(self):
+    def test_get_latest_insight_worsening_trend(self, glucose_latest):
         """
         Test that worsening trend is correctly identified.
         Requirements: 12.4
         """
-        response = client.get("/tests/GLUCOSE/latest-insight", headers=get_auth_headers())
+        response, data = glucose_latest
         
         assert response.status_code == 200
-        data = response.json()
         
         # Glucose went from 85.0 (NORMAL) to 110.0 (HIGH) - should be worsening
         guidance = data["guidance"]
         assert guidance["trend"] == "worsening"
     
-    def test_get_latest_insight_nonexistent_test(self):
+    def test_get_latest_insight_nonexistent_test(self, client, auth_headers):
         """
         Test 404 response for non-existent test key.
         """
-        response = client.get("/tests/INVALID/latest-insight", headers=get_auth_headers())
+        response = client.get("/tests/INVALID/latest-insight", headers=auth_headers)
         
         assert response.status_code == 404
         assert "not found" in response.json()["detail"].lower()
     
-    def test_get_latest_insight_no_results(self):
+    def test_get_latest_insight_no_results(self, client):
         """
         Test 404 response when user has no results for the test.
         """
@@ -345,96 +362,65 @@ class TestLatestInsightEndpoint:
         finally:
             db.close()
     
-    def test_get_latest_insight_requires_authentication(self):
+    def test_get_latest_insight_requires_authentication(self, client):
         """
         Test that latest insight endpoint requires authentication.
         """
         response = client.get("/tests/WBC/latest-insight")
         assert response.status_code == 401
     
-    def test_get_latest_insight_cbc_guidance(self):
+    @pytest.mark.parametrize("test_key, keywords", [
+        # CBC guidance should mention blood cells (Requirement 13.1)
+        ("WBC", ("blood", "cell", "wbc")),
+        # Metabolic guidance should mention relevant organ function (Requirement 13.2)
+        ("GLUCOSE", ("glucose", "sugar", "blood")),
+        # Lipid guidance should mention heart health (Requirement 13.3)
+        ("LDL", ("cholesterol", "heart", "ldl")),
+    ])
+    def test_get_latest_insight_panel_guidance(self, request, test_key, keywords):
         """
-        Test that CBC tests receive appropriate guidance.
-        Requirements: 12.3, 13.1
+        Test that each panel's tests receive appropriate guidance.
+        Requirements: 12.3, 13.1, 13.2, 13.3
         """
-        response = client.get("/tests/WBC/latest-insight", headers=get_auth_headers())
+        response, data = request.getfixturevalue(f"{test_key.lower()}_latest")
         
         assert response.status_code == 200
-        data = response.json()
         
         guidance = data["guidance"]
         message = guidance["message"].lower()
         
-        # CBC guidance should mention blood cells
-        assert "blood" in message or "cell" in message or "wbc" in message
+        assert any(keyword in message for keyword in keywords)
     
-    def test_get_latest_insight_metabolic_guidance(self):
+    @pytest.mark.parametrize("test_key", ["WBC", "GLUCOSE", "LDL"])
+    def test_get_latest_insight_disclaimer_always_present(self, request, test_key):
         """
-        Test that Metabolic Panel tests receive appropriate guidance.
-        Requirements: 12.3, 13.2
+        Test that disclaimer is always present in guidance.
+        Requirements: 12.5, 13.4, 13.5
         """
-        response = client.get("/tests/GLUCOSE/latest-insight", headers=get_auth_headers())
+        response, data = request.getfixturevalue(f"{test_key.lower()}_latest")
         
         assert response.status_code == 200
-        data = response.json()
         
         guidance = data["guidance"]
-        message = guidance["message"].lower()
-        
-        # Metabolic guidance should mention relevant organ function
-        assert "glucose" in message or "sugar" in message or "blood" in message
-    
-    def test_get_latest_insight_lipid_guidance(self):
-        """
-        Test that Lipid Panel tests receive appropriate guidance.
-        Requirements: 12.3, 13.3
-        """
-        response = client.get("/tests/LDL/latest-insight", headers=get_auth_headers())
+        disclaimer = guidance["disclaimer"].lower()
         
-        assert response.status_code == 200
-        data = response.json()
+        # Requirement 13.4: Disclaimer states information is educational and not diagnostic
+        assert "not a medical diagnosis" in disclaimer or "not a diagnosis" in disclaimer
         
-        guidance = data["guidance"]
-        message = guidance["message"].lower()
+        # Requirement 13.5: Disclaimer recommends consulting a doctor
+        assert "doctor" in disclaimer or "physician" in disclaimer
         
-        # Lipid guidance should mention heart health
-        assert "cholesterol" in message or "heart" in message or "ldl" in message
-    
-    def test_get_latest_insight_disclaimer_always_present(self):
-        """
-        Test that disclaimer is always present in guidance.
-        Requirements: 12.5, 13.4, 13.5
-        """
-        # Test multiple different tests
-        test_keys = ["WBC", "GLUCOSE", "LDL"]
-        
-        for test_key in test_keys:
-            response = client.get(f"/tests/{test_key}/latest-insight", headers=get_auth_headers())
-            
-            assert response.status_code == 200
-            data = response.json()
-            
-            guidance = data["guidance"]
-            disclaimer = guidance["disclaimer"].lower()
-            
-            # Requirement 13.4: Disclaimer states information is educational and not diagnostic
-            assert "not a medical diagnosis" in disclaimer or "not a diagnosis" in disclaimer
-            
-            # Requirement 13.5: Disclaimer recommends consulting a doctor
-            assert "doctor" in disclaimer or "physician" in disclaimer
-            
-            # Disclaimer should be substantial, not just a token message
-            assert len(guidance["disclaimer"]) > 50
+        # Disclaimer should be substantial, not just a token message
+        assert len(guidance["disclaimer"]) > 50
     
-    def test_get_latest_insight_suggestions_present(self):
+    def test_get_latest_insight_suggestions_present(self, wbc_latest):
         """
         Test that suggestions are always provided.
         Requirements: 12.3
         """
-        response = client.get("/tests/WBC/latest-insight", headers=get_auth_headers())
+        response, data = wbc_latest
         
         assert response.status_code == 200
-        data = response.json()
         
         guidance = data["guidance"]
         suggestions = guidance["suggestions"]
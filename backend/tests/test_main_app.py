@@ -11,10 +11,39 @@ from sqlalchemy.exc import SQLAlchemyError
 from app.main import app
 
 
-client = TestClient(app)
+# Routes every router must contribute to the OpenAPI schema
+EXPECTED_PATHS = frozenset({
+    # Auth endpoints
+    "/auth/register",
+    "/auth/login",
+    # User endpoints
+    "/users/me",
+    # Report endpoints
+    "/reports/upload",
+    # Test endpoints
+    "/panels",
+    "/panels/{panel_key}/tests",
+    "/tests/{test_key}/history",
+    "/tests/{test_key}/latest-insight",
+})
+
+
+@pytest.fixture(scope="module")
+def client():
+    """Single TestClient for the module, started once via its context manager"""
+    with TestClient(app) as test_client:
+        yield test_client
+
+
+@pytest.fixture(scope="module")
+def openapi_schema(client):
+    """OpenAPI schema served by the app, fetched once for the module"""
+    response = client.get("/openapi.json")
+    assert response.status_code == 200
+    return response.json()
 
 
-def test_root_endpoint():
+def test_root_endpoint(client):
     """Test the root endpoint returns correct information."""
     response = client.get("/")
     assert response.status_code == 200
@@ -25,7 +54,7 @@ def test_root_endpoint():
     assert data["version"] == "1.0.0"
 
 
-def test_health_check_endpoint():
+def test_health_check_endpoint(client):
     """Test the health check endpoint."""
     response = client.get("/health")
     assert response.status_code == 200
@@ -34,50 +63,30 @@ def test_health_check_endpoint():
     assert data["version"] == "1.0.0"
 
 
-def test_cors_headers():
+def test_cors_headers(client):
     """Test that CORS headers are properly configured."""
     response = client.options("/", headers={"Origin": "http://localhost:3000"})
     # CORS middleware should add appropriate headers
     assert "access-control-allow-origin" in response.headers
 
 
-def test_openapi_docs_available():
+def test_openapi_docs_available(client, openapi_schema):
     """Test that OpenAPI documentation is available."""
     response = client.get("/docs")
     assert response.status_code == 200
-    
-    response = client.get("/openapi.json")
-    assert response.status_code == 200
-    data = response.json()
-    assert "openapi" in data
-    assert "info" in data
-    assert data["info"]["title"] == "Lab Report Companion API"
 
+    assert "openapi" in openapi_schema
+    assert "info" in openapi_schema
+    assert openapi_schema["info"]["title"] == "Lab Report Companion API"
 
-def test_all_routers_registered():
+
+def test_all_routers_registered(openapi_schema):
     """Test that all required routers are registered."""
-    response = client.get("/openapi.json")
-    data = response.json()
-    paths = data["paths"]
-    
-    # Check auth endpoints
-    assert "/auth/register" in paths
-    assert "/auth/login" in paths
-    
-    # Check user endpoints
-    assert "/users/me" in paths
-    
-    # Check report endpoints
-    assert "/reports/upload" in paths
-    
-    # Check test endpoints
-    assert "/panels" in paths
-    assert "/panels/{panel_key}/tests" in paths
-    assert "/tests/{test_key}/history" in paths
-    assert "/tests/{test_key}/latest-insight" in paths
-
-
-def test_validation_error_handler():
+    missing = EXPECTED_PATHS - openapi_schema["paths"].keys()
+    assert not missing, f"Missing routes: {sorted(missing)}"
+
+
+def test_validation_error_handler(client):
     """Test that validation errors are handled properly."""
     # Try to register with invalid data (missing required fields)
     response = client.post("/auth/register", json={})
@@ -86,7 +95,7 @@ def test_validation_error_handler():
     assert "detail" in data
 
 
-def test_404_for_nonexistent_endpoint():
+def test_404_for_nonexistent_endpoint(client):
     """Test that non-existent endpoints return 404."""
     response = client.get("/nonexistent")
     assert response.status_code == 404
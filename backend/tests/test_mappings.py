@@ -10,7 +10,7 @@ from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker
 from app.db.base import Base
 from app.db.models import Panel, TestType, TestAlias
-from app.parsing.mappings import map_test_name_to_type
+from app.parsing.mappings import map_test_name_to_type, map_test_names_to_types
 
 
 # Create an in-memory SQLite database for testing
@@ -198,3 +198,24 @@ class TestMapTestNameToType:
             result = map_test_name_to_type(db_session, test_case)
             assert result is not None, f"Failed for: {test_case}"
             assert result.key == "WBC", f"Wrong key for: {test_case}"
+
+
+class TestMapTestNamesToTypes:
+    """Test the map_test_names_to_types function"""
+    
+    def test_matches_single_name_mapping(self, db_session):
+        """Test that bulk mapping matches per-name mapping in input order"""
+        raw_names = ["WBC", "  glu  ", "unknown_test", "", "LDL-C", "wbc", "   "]
+        
+        results = map_test_names_to_types(db_session, raw_names)
+        
+        assert results == [
+            map_test_name_to_type(db_session, raw_name) for raw_name in raw_names
+        ]
+        assert [r.key if r else None for r in results] == [
+            "WBC", "GLUCOSE", None, None, "LDL", "WBC", None
+        ]
+    
+    def test_no_names(self, db_session):
+        """Test that an empty input returns an empty list"""
+        assert map_test_names_to_types(db_session, []) == []
@@ -85,6 +85,12 @@ class TestOCRPostprocessing:
         cleaned = clean_ocr_text(text)
         assert "102" in cleaned
     
+    def test_clean_ocr_text_fixes_repeated_errors(self):
+        """Test that every OCR error in a run of digits is fixed."""
+        assert clean_ocr_text("Value: 5O5O5") == "Value: 50505"
+        assert clean_ocr_text("Glucose: 9S mg/dL") == "Glucose: 95 mg/dL"
+        assert clean_ocr_text("CO2 25 mmol/L") == "CO2 25 mmol/L"
+    
     def test_clean_ocr_text_empty_string(self):
         """Test that empty string is handled."""
         assert clean_ocr_text("") == ""
@@ -163,6 +163,61 @@ class TestPanelsEndpoint:
         
         # Order should be consistent across calls
         assert [p["key"] for p in data1] == [p["key"] for p in data2]
+    
+    def test_get_panels_not_modified_with_matching_etag(self):
+        """
+        Test that a matching If-None-Match returns 304 without a body.
+        """
+        response = client.get("/panels", headers=get_auth_headers())
+        etag = response.headers["etag"]
+        
+        cached = client.get(
+            "/panels",
+            headers={**get_auth_headers(), "If-None-Match": etag}
+        )
+        
+        assert cached.status_code == 304
+        assert cached.headers["etag"] == etag
+        assert cached.content == b""
+
+    def test_get_panels_not_modified_with_weak_etag_list(self):
+        """
+        Test that If-None-Match lists and weak tags are matched.
+        """
+        response = client.get("/panels", headers=get_auth_headers())
+        etag = response.headers["etag"]
+
+        cached = client.get(
+            "/panels",
+            headers={**get_auth_headers(), "If-None-Match": f'"stale", W/{etag}'}
+        )
+
+        assert cached.status_code == 304
+
+    def test_get_panels_picks_up_newly_seeded_panel(self):
+        """
+        Test that panels added after the catalog was cached are returned.
+        """
+        response = client.get("/panels", headers=get_auth_headers())
+        etag = response.headers["etag"]
+
+        db = TestingSessionLocal()
+        panel = Panel(key="THYROID", display_name="Thyroid Panel")
+        db.add(panel)
+        db.commit()
+        try:
+            refreshed = client.get(
+                "/panels",
+                headers={**get_auth_headers(), "If-None-Match": etag}
+            )
+
+            assert refreshed.status_code == 200
+            assert refreshed.headers["etag"] != etag
+            assert "THYROID" in [p["key"] for p in refreshed.json()]
+        finally:
+            db.delete(panel)
+            db.commit()
+            db.close()
 
 
 class TestPanelTestsEndpoint:
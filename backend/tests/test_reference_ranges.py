@@ -0,0 +1,79 @@
+"""
+Tests for the reference ranges module.
+
+This module tests status computation (LOW, NORMAL, HIGH, CRITICAL, PROTECTIVE)
+for single results and for whole-report batches.
+"""
+
+import pytest
+from app.rules.reference_ranges import compute_status, compute_status_batch
+
+
+class MockTestType:
+    """Mock TestType object for testing."""
+    def __init__(self, key: str, ref_low: float = None, ref_high: float = None):
+        self.key = key
+        self.ref_low = ref_low
+        self.ref_high = ref_high
+
+
+class TestComputeStatus:
+    """Test suite for compute_status function."""
+
+    @pytest.mark.parametrize("value,expected", [
+        (2.0, "CRITICAL_LOW"),
+        (4.0, "LOW"),
+        (4.5, "NORMAL"),
+        (11.0, "NORMAL"),
+        (12.0, "HIGH"),
+        (17.0, "CRITICAL_HIGH"),
+    ])
+    def test_status_thresholds(self, value, expected):
+        """Test each status band against the WBC reference range."""
+        test_type = MockTestType("WBC", 4.5, 11.0)
+
+        assert compute_status(test_type, value) == expected
+
+    def test_unknown_without_reference_ranges(self):
+        """Test that UNKNOWN is returned when ranges are not defined."""
+        test_type = MockTestType("XYZ", None, None)
+
+        assert compute_status(test_type, 5.0) == "UNKNOWN"
+
+    def test_hdl_protective(self):
+        """Test that HDL >= 60 is PROTECTIVE."""
+        test_type = MockTestType("HDL", 40.0, 999.0)
+
+        assert compute_status(test_type, 65.0) == "PROTECTIVE"
+
+    def test_personalized_range_applied(self):
+        """Test that gender-specific ranges change the status."""
+        test_type = MockTestType("HGB", 13.5, 17.5)
+
+        assert compute_status(test_type, 13.0) == "LOW"
+        assert compute_status(test_type, 13.0, patient_gender="F") == "NORMAL"
+
+
+class TestComputeStatusBatch:
+    """Test suite for compute_status_batch function."""
+
+    def test_batch_matches_single_row_status(self):
+        """Test that batch statuses match per-row compute_status in input order."""
+        wbc = MockTestType("WBC", 4.5, 11.0)
+        hgb = MockTestType("HGB", 13.5, 17.5)
+        hdl = MockTestType("HDL", 40.0, 999.0)
+        unknown = MockTestType("XYZ", None, None)
+        test_types = [wbc, hgb, wbc, hdl, unknown, hgb, hdl]
+        values = [3.0, 13.0, 20.0, 65.0, 1.0, 18.0, 45.0]
+
+        for gender, age in [(None, None), ("F", 30), ("M", 70)]:
+            statuses = compute_status_batch(test_types, values, gender, age)
+
+            assert statuses == [
+                compute_status(test_type, value, gender, age)
+                for test_type, value in zip(test_types, values)
+            ]
+
+    def test_batch_with_no_rows(self):
+        """Test that an empty batch returns an empty list."""
+        assert compute_status_batch([], []) == []